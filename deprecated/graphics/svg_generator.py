@@ -5,14 +5,58 @@ SVG overlay generator using OCR to detect template tags in images
 import os
 import json
 import re
+import sys
 import logging
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Tuple, Optional, Set
+import functools
+import uuid
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from io import BytesIO
+from types import MappingProxyType
+from xml.sax.saxutils import escape
+from typing import AbstractSet, FrozenSet, List, Dict, Tuple, Optional, Set, Mapping
 from PIL import Image
 import numpy as np
 
+from graphics.template_manager import scan_overlay_tags
+
+# Prefer the C-backed lxml for SVG/XML parsing and serialization (API-compatible)
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
 logger = logging.getLogger(__name__)
 
+# Matches a template tag like "{{ Button 1 }}" and captures its content
+_TAG_RE = re.compile(r'\{\{\s*([^}]+?)\s*\}\}')
+
+# Group that holds tags added by update_existing_svg; the shared presentation
+# attributes live on the group instead of being repeated on every <text>
+_AUTO_TAGS_GROUP_ATTRS = {
+    'id': 'auto-tags',
+    'font-family': 'Arial',
+    'font-size': '10',
+    'fill': 'black',
+    'text-anchor': 'middle',
+}
+_AUTO_TAGS_GROUP_OPEN = b'<g id="auto-tags"'
+
+# Confidence at or above this is treated as certain and not written to the SVG
+_CONFIDENCE_OMIT_THRESHOLD = 0.99
+
+# Tag kinds, in the order their sections appear in generated SVGs
+_TAG_KIND_BUTTON, _TAG_KIND_HAT, _TAG_KIND_OTHER = 0, 1, 2
+_TAG_KIND_HEADERS = {
+    _TAG_KIND_BUTTON: '  <!-- Button bindings -->',
+    _TAG_KIND_HAT: '  <!-- Hat switch bindings -->',
+    _TAG_KIND_OTHER: '  <!-- Other bindings -->',
+}
+
 
 class SVGOverlayGenerator:
     """Generates SVG overlay files from template images using OCR"""
@@ -21,6 +65,7 @@ class SVGOverlayGenerator:
         self.reader = None
         self.config = None
         self.profile_buttons = set()  # Buttons found in profile XML
+        self._existing_tags_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}  # svg_path -> (mtime_ns, tags)
 
     def initialize_ocr(self):
         """Lazy initialization of EasyOCR reader"""
@@ -66,22 +111,26 @@ class SVGOverlayGenerator:
             # Find all actions within this action map
             for action in action_map.findall('.//action'):
                 action_name = action.get('name', '')
+                if not action_name:
+                    continue
 
                 # Find rebind elements within this action
                 for rebind in action.findall('.//rebind'):
-                    input_code = rebind.get('input', '').strip()
+                    # Most rebinds belong to other devices - reject them before any string work
+                    input_code = rebind.get('input')
+                    if input_code is None or not input_code.startswith(js_prefix):
+                        continue
 
-                    # Skip empty or whitespace-only inputs (cleared bindings)
-                    if not input_code or input_code == js_prefix or input_code == f"{js_prefix} ":
+                    # Skip cleared bindings (just the joystick prefix, possibly with whitespace)
+                    input_code = input_code.strip()
+                    if len(input_code) == len(js_prefix):
                         continue
 
-                    # Check if it's an input for our joystick instance and has an action
-                    if input_code.startswith(js_prefix) and action_name:
-                        # Parse the input code to get a human-readable label
-                        input_label = self._parse_input_code(input_code, joystick_instance)
-                        if input_label:
-                            # Store the mapping (last one wins if multiple bindings)
-                            input_mappings[input_label] = action_name
+                    # Parse the input code to get a human-readable label
+                    input_label = self._parse_input_code(input_code, joystick_instance)
+                    if input_label:
+                        # Store the mapping (last one wins if multiple bindings)
+                        input_mappings[input_label] = action_name
 
         if input_mappings:
             logger.info(f"Found {len(input_mappings)} mapped inputs in profile for joystick instance {joystick_instance}")
@@ -129,7 +178,8 @@ class SVGOverlayGenerator:
         logger.debug(f"Unknown input type: {input_code}")
         return None
 
-    def load_config(self, config_path: str) -> Optional[Dict]:
+    @staticmethod
+    def load_config(config_path: str) -> Optional[Dict]:
         """
         Load SVG styling configuration from a JSON file
 
@@ -151,7 +201,8 @@ class SVGOverlayGenerator:
             logger.error(f"Error loading config: {e}", exc_info=True)
             return None
 
-    def get_style_config(self, config: Optional[Dict] = None) -> Dict:
+    @staticmethod
+    def get_style_config(config: Optional[Dict] = None) -> Mapping:
         """
         Get styling configuration with defaults
 
@@ -159,7 +210,7 @@ class SVGOverlayGenerator:
             config: Configuration dictionary (optional)
 
         Returns:
-            Dict with font_family, font_size, fill, text_anchor, stroke, background, etc.
+            Mapping with font_family, font_size, fill, text_anchor, stroke, background, etc.
         """
         defaults = {
             'font_family': 'Arial',
@@ -188,26 +239,15 @@ class SVGOverlayGenerator:
         if config is None:
             return defaults
 
-        # Merge config with defaults
-        style = defaults.copy()
-        if 'svg_style' in config:
-            config_copy = config['svg_style'].copy()
-
-            # Handle nested dicts separately to merge properly
-            nested_keys = ['background', 'text_wrap']
-            for key in nested_keys:
-                if key in config_copy:
-                    nested_config = config_copy[key]
-                    style[key] = defaults[key].copy()
-                    style[key].update(nested_config)
-                    del config_copy[key]
-
-            # Update remaining flat properties
-            style.update(config_copy)
+        # Layer user settings over defaults with ChainMap - lookups fall through
+        # to the defaults, so nothing is copied or merged up front
+        user_style = config.get('svg_style', {})
+        nested = {key: ChainMap(user_style.get(key, {}), defaults[key])
+                  for key in ('background', 'text_wrap')}
+        return ChainMap(nested, user_style, defaults)
 
-        return style
-
-    def get_table_config(self, config: Optional[Dict] = None) -> Optional[Dict]:
+    @staticmethod
+    def get_table_config(config: Optional[Dict] = None) -> Optional[Dict]:
         """
         Get unmapped table configuration
 
@@ -266,9 +306,23 @@ class SVGOverlayGenerator:
         Returns:
             List of detected tags with positions and text
         """
+        tags = self._run_tag_ocr(image_path)
+        return tags if tags is not None else []
+
+    def _run_tag_ocr(self, image_path: str) -> Optional[List[Dict]]:
+        """
+        Run OCR on an image and extract its template tags
+
+        Args:
+            image_path: Path to template image
+
+        Returns:
+            List of detected tags, or None if OCR is unavailable or failed
+            (so callers can tell a failed pass from an image without tags)
+        """
         self.initialize_ocr()
         if self.reader is None:
-            return []
+            return None
 
         logger.info(f"Reading image: {image_path}")
         image = Image.open(image_path)
@@ -278,44 +332,104 @@ class SVGOverlayGenerator:
             results = self.reader.readtext(np.array(image))
         except Exception as e:
             logger.error(f"OCR reading error: {e}", exc_info=True)
-            return []
+            return None
+
+        tags = self._extract_tags(results)
+        logger.info(f"Found {len(tags)} template tags")
+        return tags
+
+    def detect_template_tags_batch(self, image_paths: List[str]) -> List[Optional[List[Dict]]]:
+        """
+        Detect template tags in several images with batched OCR
+
+        EasyOCR's readtext_batched requires all images in a batch to have the same
+        size, so images are grouped by dimensions and each group is read in one call.
+
+        Args:
+            image_paths: Paths to template images
+
+        Returns:
+            List of detected tag lists, in the same order as image_paths
+            (None for images that could not be read)
+        """
+        self.initialize_ocr()
+        if self.reader is None:
+            return [[] for _ in image_paths]
+
+        all_tags: List[Optional[List[Dict]]] = [[] for _ in image_paths]
+
+        # Group images by size so each group can be batched
+        groups: Dict[Tuple[int, int], List[Tuple[int, np.ndarray]]] = {}
+        for index, image_path in enumerate(image_paths):
+            logger.info(f"Reading image: {image_path}")
+            try:
+                with Image.open(image_path) as image:
+                    image_array = np.array(image)
+            except Exception as e:
+                # One unreadable image must not abort the rest of the batch
+                logger.error(f"Error reading image {image_path}: {e}", exc_info=True)
+                all_tags[index] = None
+                continue
+            groups.setdefault(image_array.shape[:2], []).append((index, image_array))
+
+        for size, entries in groups.items():
+            logger.info(f"Running batched OCR detection on {len(entries)} image(s) of size {size[1]}x{size[0]}...")
+            try:
+                batch_results = self.reader.readtext_batched([image_array for _, image_array in entries])
+            except Exception as e:
+                logger.error(f"OCR reading error: {e}", exc_info=True)
+                continue
+
+            for (index, _), results in zip(entries, batch_results):
+                all_tags[index] = self._extract_tags(results)
+                logger.info(f"Found {len(all_tags[index])} template tags in {image_paths[index]}")
+
+        return all_tags
+
+    def _extract_tags(self, results: List) -> List[Dict]:
+        """
+        Extract template tags from raw OCR results
+
+        Args:
+            results: EasyOCR results as (bbox, text, confidence) tuples
 
+        Returns:
+            List of detected tags with positions and text
+        """
         tags = []
         for bbox, text, confidence in results:
-            # Check if this text contains template tag markers
-            if '{{' in text and '}}' in text:
-                # Extract the content between {{ }}
-                import re
-                match = re.search(r'\{\{\s*([^}]+)\s*\}\}', text)
-                if match:
-                    tag_content = match.group(1).strip()
-
-                    # Get bounding box center
-                    # bbox is [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-                    x_coords = [point[0] for point in bbox]
-                    y_coords = [point[1] for point in bbox]
-
-                    center_x = sum(x_coords) / len(x_coords)
-                    center_y = sum(y_coords) / len(y_coords)
-
-                    # Calculate box dimensions
-                    x1, y1 = bbox[0]
-                    x2, y2 = bbox[2]
-                    width = x2 - x1
-                    height = y2 - y1
-
-                    tags.append({
-                        'tag': tag_content,
-                        'x': center_x,
-                        'y': center_y,
-                        'bbox': bbox,
-                        'width': width,
-                        'height': height,
-                        'confidence': confidence,
-                        'original_text': text
-                    })
+            # Extract the content between {{ }} (skip text without template tag markers)
+            match = _TAG_RE.search(text)
+            if match is None:
+                continue
+            # Interned so membership tests against scanned SVG tags can match by identity
+            tag_content = sys.intern(match.group(1).strip())
+
+            # Get bounding box center
+            # bbox is [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
+            x_coords = [point[0] for point in bbox]
+            y_coords = [point[1] for point in bbox]
+
+            center_x = sum(x_coords) / len(x_coords)
+            center_y = sum(y_coords) / len(y_coords)
+
+            # Calculate box dimensions
+            x1, y1 = bbox[0]
+            x2, y2 = bbox[2]
+            width = x2 - x1
+            height = y2 - y1
+
+            tags.append({
+                'tag': tag_content,
+                'x': center_x,
+                'y': center_y,
+                'bbox': bbox,
+                'width': width,
+                'height': height,
+                'confidence': confidence,
+                'original_text': text
+            })
 
-        logger.info(f"Found {len(tags)} template tags")
         return tags
 
     def generate_svg_overlay(self, image_path: str, output_path: str = None,
@@ -337,48 +451,141 @@ class SVGOverlayGenerator:
         Returns:
             Path to generated SVG file
         """
-        # Get image dimensions
-        image = Image.open(image_path)
-        img_width, img_height = image.size
+        # Parse profile for mapped buttons if provided
+        profile_buttons = {}
+        if profile_path:
+            logger.info(f"Parsing profile: {profile_path}")
+            profile_buttons = self.parse_profile_buttons(profile_path, joystick_instance)
 
-        # Try to load config from same directory as image if not specified
-        if config_path is None:
-            image_dir = os.path.dirname(image_path)
-            auto_config_path = os.path.join(image_dir, 'config.json')
-            if os.path.exists(auto_config_path):
-                config_path = auto_config_path
+        # Detect template tags
+        tags = self.detect_template_tags(image_path)
 
-        # Load configuration
-        config = None
-        if config_path:
-            config = self.load_config(config_path)
+        return self._write_one_svg(image_path, tags, output_path, profile_buttons,
+                                   font_family, font_size, config_path)
 
-        # Get style configuration
-        style = self.get_style_config(config)
+    def generate_svg_overlay_batch(self, image_paths: List[str], output_dir: str = None,
+                                  profile_path: str = None, joystick_instance: int = 1,
+                                  font_family: str = None, font_size: int = None,
+                                  config_path: str = None,
+                                  max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Generate SVG overlay files for several template images
 
-        # Override with explicit parameters if provided
-        if font_family is not None:
-            style['font_family'] = font_family
-        if font_size is not None:
-            style['font_size'] = font_size
+        The profile is parsed once and OCR runs batched for all images; SVG files
+        are then written in a thread pool since writing is I/O-bound.
 
-        # Parse profile for mapped buttons if provided
+        Args:
+            image_paths: Paths to template images
+            output_dir: Directory to save SVGs (optional, defaults to next to each image)
+            profile_path: Path to SC profile XML to find unmapped buttons (optional)
+            joystick_instance: Joystick instance number if using profile_path (default 1)
+            font_family: Font family for text (optional, overrides config)
+            font_size: Font size for text (optional, overrides config)
+            config_path: Path to config.json (optional, auto-detected per image directory)
+            max_workers: Maximum number of writer threads (optional)
+
+        Returns:
+            List of generated SVG paths (None for failed images), in the same order as image_paths
+        """
+        if not image_paths:
+            return []
+
+        # Parse profile once for all images
         profile_buttons = {}
         if profile_path:
             logger.info(f"Parsing profile: {profile_path}")
             profile_buttons = self.parse_profile_buttons(profile_path, joystick_instance)
 
-        # Detect template tags
-        tags = self.detect_template_tags(image_path)
+        # Detect template tags for all images
+        all_tags = self.detect_template_tags_batch(image_paths)
+
+        # Images with the same base name from different directories would map to
+        # the same file in output_dir; only the first of them is written
+        output_paths: List[Optional[str]] = [None] * len(image_paths)
+        if output_dir:
+            claimed = {}
+            for index, image_path in enumerate(image_paths):
+                base_name = os.path.splitext(os.path.basename(image_path))[0]
+                output_path = os.path.join(output_dir, f"{base_name}_overlay.svg")
+                key = os.path.normcase(os.path.abspath(output_path))
+                if key in claimed:
+                    logger.error(f"Skipping {image_path}: its overlay {output_path} "
+                                 f"would overwrite the one for {image_paths[claimed[key]]}")
+                    all_tags[index] = None
+                    continue
+                claimed[key] = index
+                output_paths[index] = output_path
+
+        def write_one(job: Tuple[str, Optional[List[Dict]], Optional[str]]) -> Optional[str]:
+            image_path, tags, output_path = job
+            if tags is None:
+                # Image could not be read for OCR, or its output path is taken
+                return None
+            try:
+                return self._write_one_svg(image_path, tags, output_path, profile_buttons,
+                                           font_family, font_size, config_path)
+            except Exception as e:
+                logger.error(f"Error generating SVG overlay for {image_path}: {e}", exc_info=True)
+                return None
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(write_one, zip(image_paths, all_tags, output_paths)))
+
+        logger.info(f"Generated {sum(1 for r in results if r)} of {len(image_paths)} SVG overlays")
+        return results
+
+    def _write_one_svg(self, image_path: str, tags: List[Dict], output_path: str = None,
+                       profile_buttons: Dict[str, str] = None, font_family: str = None,
+                       font_size: int = None, config_path: str = None) -> Optional[str]:
+        """
+        Build and write the SVG overlay for one image from already-detected tags
+
+        Args:
+            image_path: Path to template image
+            tags: Template tags detected in the image
+            output_path: Path to save SVG (optional, defaults to same name as image)
+            profile_buttons: Dict mapping input labels to action names (optional)
+            font_family: Font family for text (optional, overrides config)
+            font_size: Font size for text (optional, overrides config)
+            config_path: Path to config.json (optional, auto-detected if in same dir)
+
+        Returns:
+            Path to generated SVG file, or None if there was nothing to write
+        """
+        # Get image dimensions
+        with Image.open(image_path) as image:
+            img_width, img_height = image.size
+
+        # Try to load config from same directory as image if not specified
+        if config_path is None:
+            image_dir = os.path.dirname(image_path)
+            auto_config_path = os.path.join(image_dir, 'config.json')
+            if os.path.exists(auto_config_path):
+                config_path = auto_config_path
+
+        # Get style configuration (cached per config path + mtime)
+        config_mtime_ns = _config_mtime_ns(config_path)
+        style = _load_and_merge_style(config_path, config_mtime_ns)
+
+        # Override with explicit parameters if provided (copy - cached style is read-only)
+        if font_family is not None or font_size is not None:
+            style = dict(style)
+            if font_family is not None:
+                style['font_family'] = font_family
+            if font_size is not None:
+                style['font_size'] = font_size
 
         if not tags:
-            logger.warning("No template tags found in image")
+            logger.warning(f"No template tags found in image: {image_path}")
             if not profile_buttons:
                 return None
             logger.info("Will create SVG with profile buttons only")
 
         # Get table configuration
-        table_config = self.get_table_config(config)
+        table_config = _load_and_merge_table(config_path, config_mtime_ns)
 
         # Create SVG
         svg_content = self._create_svg_content(tags, img_width, img_height, style, profile_buttons, table_config)
@@ -388,9 +595,8 @@ class SVGOverlayGenerator:
             base_name = os.path.splitext(image_path)[0]
             output_path = f"{base_name}_overlay.svg"
 
-        # Write SVG file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        # Write SVG file (via temp file so a crash never leaves a partial SVG)
+        _atomic_write(output_path, svg_content.encode('utf-8'))
 
         logger.info(f"SVG overlay saved to: {output_path}")
         return output_path
@@ -434,40 +640,29 @@ class SVGOverlayGenerator:
             ''
         ]
 
-        # Group tags by type for organization
-        button_tags = []
-        hat_tags = []
-        other_tags = []
+        # Classify tags by kind, precomputing the numeric sort key for buttons
         detected_buttons = set()
 
         for tag_info in tags:
             tag = tag_info['tag']
             if tag.startswith('Button'):
-                button_tags.append(tag_info)
+                # e.g., "Button 12" -> 12
+                last_word = tag.rsplit(None, 1)[-1]
+                tag_info['kind'] = _TAG_KIND_BUTTON
+                tag_info['_sort_num'] = int(last_word) if last_word.isdigit() else 0
                 detected_buttons.add(tag)
             elif 'Hat' in tag:
-                hat_tags.append(tag_info)
+                tag_info['kind'] = _TAG_KIND_HAT
+                tag_info['_sort_num'] = 0
             else:
-                other_tags.append(tag_info)
-
-        # Add button tags
-        if button_tags:
-            lines.append('  <!-- Button bindings -->')
-            for tag_info in sorted(button_tags, key=lambda x: int(x['tag'].split()[-1]) if x['tag'].split()[-1].isdigit() else 0):
-                lines.append(self._create_text_element(tag_info, style))
-            lines.append('')
-
-        # Add hat tags
-        if hat_tags:
-            lines.append('  <!-- Hat switch bindings -->')
-            for tag_info in hat_tags:
-                lines.append(self._create_text_element(tag_info, style))
-            lines.append('')
-
-        # Add other tags
-        if other_tags:
-            lines.append('  <!-- Other bindings -->')
-            for tag_info in other_tags:
+                tag_info['kind'] = _TAG_KIND_OTHER
+                tag_info['_sort_num'] = 0
+
+        # One stable sort orders buttons numerically and keeps hat/other tags in
+        # detection order; groupby then emits each section in a single sweep
+        for kind, group in groupby(sorted(tags, key=itemgetter('kind', '_sort_num')), key=itemgetter('kind')):
+            lines.append(_TAG_KIND_HEADERS[kind])
+            for tag_info in group:
                 lines.append(self._create_text_element(tag_info, style))
             lines.append('')
 
@@ -588,39 +783,23 @@ class SVGOverlayGenerator:
             )
 
         # Add data rows
-        for i, input_label in enumerate(input_labels):
-            row_y = y + (i + 2) * row_height - row_height / 2 + font_size / 3
+        # Build one format template per column up front; rows only fill in x/y/label
+        cell_attrs = f'font-family="{font_family}" font-size="{font_size}" fill="{fill}" text-anchor="start"'
+        if stroke:
+            cell_attrs += f' stroke="{stroke}" stroke-width="{stroke_width}"'
+        cell_attrs = cell_attrs.replace('{', '{{').replace('}', '}}')
 
-            # Action column (with template tag)
-            action_attrs = [
-                f'x="{x + 5}"',  # Left-aligned with padding
-                f'y="{row_y}"',
-                f'font-family="{font_family}"',
-                f'font-size="{font_size}"',
-                f'fill="{fill}"',
-                f'text-anchor="start"'
-            ]
-            if stroke:
-                action_attrs.append(f'stroke="{stroke}"')
-                action_attrs.append(f'stroke-width="{stroke_width}"')
-
-            # Use template tag for action (will be replaced during rendering)
-            elements.append(f'    <text {" ".join(action_attrs)}>{{{{ {input_label} }}}}</text>')
-
-            # Input column (show input label)
-            input_attrs = [
-                f'x="{x + col_widths[0] + 5}"',  # Left-aligned with padding
-                f'y="{row_y}"',
-                f'font-family="{font_family}"',
-                f'font-size="{font_size}"',
-                f'fill="{fill}"',
-                f'text-anchor="start"'
-            ]
-            if stroke:
-                input_attrs.append(f'stroke="{stroke}"')
-                input_attrs.append(f'stroke-width="{stroke_width}"')
+        # Action column uses template tag (will be replaced during rendering)
+        action_template = '    <text x="{x}" y="{y}" ' + cell_attrs + '>{{{{ {label} }}}}</text>'
+        # Input column shows input label
+        input_template = '    <text x="{x}" y="{y}" ' + cell_attrs + '>{label}</text>'
 
-            elements.append(f'    <text {" ".join(input_attrs)}>{input_label}</text>')
+        action_x = x + 5  # Left-aligned with padding
+        input_x = x + col_widths[0] + 5  # Left-aligned with padding
+        for i, input_label in enumerate(input_labels):
+            row_y = y + (i + 2) * row_height - row_height / 2 + font_size / 3
+            elements.append(action_template.format(x=action_x, y=row_y, label=input_label))
+            elements.append(input_template.format(x=input_x, y=row_y, label=input_label))
 
         # Add vertical separator line between columns
         if table_config['background']['enabled']:
@@ -783,68 +962,292 @@ class SVGOverlayGenerator:
 
         return result
 
-    def update_existing_svg(self, svg_path: str, image_path: str) -> str:
+    def detect_template_tags_cached(self, image_path: str, cache_path: str) -> List[Dict]:
+        """
+        Detect template tags, reusing results cached on disk while the image is unchanged
+
+        The cache is keyed on the image's mtime and size, so an unchanged template
+        costs a stat and a JSON load instead of a full OCR pass.
+
+        Args:
+            image_path: Path to template image
+            cache_path: Path to the JSON tag cache file
+
+        Returns:
+            List of detected tags with positions and text
+        """
+        image_stat = os.stat(image_path)
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if (cache.get('image_mtime_ns') == image_stat.st_mtime_ns and
+                    cache.get('image_size') == image_stat.st_size):
+                logger.info(f"Using cached template tags from: {cache_path}")
+                tags = cache['tags']
+                for tag_info in tags:
+                    tag_info['tag'] = sys.intern(tag_info['tag'])
+                return tags
+        except (OSError, ValueError, KeyError):
+            pass
+
+        tags = self._run_tag_ocr(image_path)
+        if tags is None:
+            # Don't cache a failed pass; OCR is retried on the next call
+            return []
+
+        try:
+            cache = {
+                'image_mtime_ns': image_stat.st_mtime_ns,
+                'image_size': image_stat.st_size,
+                'tags': tags
+            }
+            _atomic_write(cache_path, json.dumps(cache, default=_json_default).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Could not write tag cache: {e}")
+
+        return tags
+
+    def scan_existing_tags(self, svg_path: str) -> Set[str]:
+        """
+        Collect the {{ tag }} contents of all <text> elements in an SVG overlay
+
+        Streams the file with iterparse and clears each element once seen, so
+        the full DOM is never materialized.
+
+        Args:
+            svg_path: Path to SVG overlay
+
+        Returns:
+            Set of tag contents (e.g., {"Button 1", "Hat 1 Up"})
+        """
+        return set(scan_overlay_tags(svg_path))
+
+    def update_existing_svg(self, svg_path: str, image_path: str,
+                            existing_tags: Optional[AbstractSet[str]] = None) -> str:
         """
         Update an existing SVG overlay with newly detected tags
 
         Args:
             svg_path: Path to existing SVG overlay
             image_path: Path to template image
+            existing_tags: Tags already in the SVG (e.g., from TemplateManager.refresh_overlay_tags);
+                scanned from the file if not provided
 
         Returns:
             Path to updated SVG file
         """
-        # Detect current tags in image
-        new_tags = self.detect_template_tags(image_path)
+        # Detect current tags in image (reuses cached results if the image is unchanged)
+        new_tags = self.detect_template_tags_cached(image_path, f"{svg_path}.tagcache.json")
 
         if not new_tags:
             logger.info("No new tags detected")
             return svg_path
 
-        # Parse existing SVG
-        try:
-            tree = ET.parse(svg_path)
-            root = tree.getroot()
-        except Exception as e:
-            logger.error(f"Error parsing SVG: {e}", exc_info=True)
-            return None
-
-        # Extract existing tags
-        existing_tags = set()
-        ns = {'svg': 'http://www.w3.org/2000/svg'}
+        # Extract existing tags with a streaming scan (no full tree is built),
+        # reusing the last scan while the SVG is unchanged on disk
+        if existing_tags is None:
+            try:
+                svg_mtime_ns = os.stat(svg_path).st_mtime_ns
+                cached = self._existing_tags_cache.get(svg_path)
+                if cached is not None and cached[0] == svg_mtime_ns:
+                    existing_tags = cached[1]
+                else:
+                    existing_tags = frozenset(self.scan_existing_tags(svg_path))
+                    self._existing_tags_cache[svg_path] = (svg_mtime_ns, existing_tags)
+            except Exception as e:
+                logger.error(f"Error parsing SVG: {e}", exc_info=True)
+                return None
 
-        for text_elem in root.findall('.//svg:text', ns):
-            text_content = text_elem.text or ''
-            if '{{' in text_content and '}}' in text_content:
-                import re
-                match = re.search(r'\{\{\s*([^}]+)\s*\}\}', text_content)
-                if match:
-                    existing_tags.add(match.group(1).strip())
+        # Steady state: every detected tag is already present, so skip the
+        # DOM parse and write entirely
+        if all(t['tag'] in existing_tags for t in new_tags):
+            logger.info("No new tags to add (all already exist in SVG)")
+            return svg_path
 
-        # Find new tags that don't exist yet
+        # Find new tags that don't exist yet (tags are interned at extraction time)
         tags_to_add = [t for t in new_tags if t['tag'] not in existing_tags]
 
-        if not tags_to_add:
-            logger.info("No new tags to add (all already exist in SVG)")
+        logger.info(f"Adding {len(tags_to_add)} new tags to SVG")
+
+        try:
+            with open(svg_path, 'rb') as f:
+                svg_bytes = f.read()
+        except OSError as e:
+            logger.error(f"Error reading SVG: {e}", exc_info=True)
+            return None
+
+        # Fast path: splice pre-serialized <text> nodes in before the closing
+        # </svg> without building a DOM
+        spliced = _splice_text_nodes(svg_bytes, tags_to_add)
+        if spliced is not None:
+            _atomic_write(svg_path, spliced)
+            logger.info(f"Updated SVG saved to: {svg_path}")
             return svg_path
 
-        logger.info(f"Adding {len(tags_to_add)} new tags to SVG")
+        # Parse the full SVG only when the document can't be spliced cleanly
+        try:
+            tree = ET.parse(BytesIO(svg_bytes))
+            root = tree.getroot()
+        except Exception as e:
+            logger.error(f"Error parsing SVG: {e}", exc_info=True)
+            return None
+
+        # Reuse the auto-tags group from an earlier update, or create it once
+        ns = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+        group = None
+        for elem in root.iter(f'{ns}g'):
+            if elem.get('id') == _AUTO_TAGS_GROUP_ATTRS['id']:
+                group = elem
+                break
+        if group is None:
+            group = ET.SubElement(root, f'{ns}g', _AUTO_TAGS_GROUP_ATTRS)
 
         # Add new tags to SVG
         for tag_info in tags_to_add:
-            text_elem = ET.Element('text')
-            text_elem.set('x', f"{tag_info['x']:.1f}")
-            text_elem.set('y', f"{tag_info['y']:.1f}")
-            text_elem.set('font-family', 'Arial')
-            text_elem.set('font-size', '10')
-            text_elem.set('fill', 'black')
-            text_elem.set('text-anchor', 'middle')
-            text_elem.set('data-confidence', f"{tag_info['confidence']:.2f}")
+            # SubElement creates and appends in one call with all attributes at once
+            text_elem = ET.SubElement(group, f'{ns}text', _text_node_attrs(tag_info))
             text_elem.text = f"{{{{ {tag_info['tag']} }}}}"
-            root.append(text_elem)
 
-        # Save updated SVG
-        tree.write(svg_path, encoding='utf-8', xml_declaration=True)
+        # Serialize in memory, then replace the file in a single write so an
+        # error mid-serialization never leaves a truncated SVG behind
+        buf = BytesIO()
+        tree.write(buf, encoding='utf-8', xml_declaration=True)
+        _atomic_write(svg_path, buf.getvalue())
         logger.info(f"Updated SVG saved to: {svg_path}")
 
         return svg_path
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, ChainMap):
+        return MappingProxyType(ChainMap(*(_freeze(layer) for layer in value.maps)))
+    return value
+
+
+def _text_node_attrs(tag_info: Dict) -> Dict[str, str]:
+    """Per-tag <text> attributes; shared styling comes from the auto-tags group"""
+    attrs = {
+        'x': f"{tag_info['x']:.1f}",
+        'y': f"{tag_info['y']:.1f}",
+    }
+    if tag_info['confidence'] < _CONFIDENCE_OMIT_THRESHOLD:
+        attrs['data-confidence'] = f"{tag_info['confidence']:.2f}"
+    return attrs
+
+
+def _splice_text_nodes(svg_bytes: bytes, tags: List[Dict]) -> Optional[bytes]:
+    """
+    Insert serialized <text> elements for tags into the auto-tags group
+
+    The group is created just before the closing </svg> on the first update.
+    Later updates append to it only while it is still the last element in the
+    document and holds nothing but text, so the splice point is unambiguous.
+
+    Args:
+        svg_bytes: Raw SVG document
+        tags: Tags to add
+
+    Returns:
+        Updated document bytes, or None if the document can't be spliced safely
+        (no trailing </svg>, content after it, a non-UTF-8 encoding, or an
+        auto-tags group that has been edited into a different shape)
+    """
+    end = svg_bytes.rfind(b'</svg>')
+    if end == -1 or svg_bytes[end + len(b'</svg>'):].strip():
+        return None
+
+    if svg_bytes.startswith(b'<?xml'):
+        declaration = svg_bytes[:svg_bytes.find(b'?>')].lower()
+        if b'encoding=' in declaration and b'utf-8' not in declaration:
+            return None
+
+    nodes = ''.join(
+        '    <text {}>{{{{ {} }}}}</text>\n'.format(
+            ' '.join(f'{name}="{value}"' for name, value in _text_node_attrs(t).items()),
+            escape(t['tag'])
+        )
+        for t in tags
+    ).encode('utf-8')
+
+    group_start = svg_bytes.rfind(_AUTO_TAGS_GROUP_OPEN, 0, end)
+    if group_start == -1:
+        if _AUTO_TAGS_GROUP_OPEN in svg_bytes:
+            return None
+        group_open = '  <g {}>\n'.format(
+            ' '.join(f'{name}="{value}"' for name, value in _AUTO_TAGS_GROUP_ATTRS.items())
+        ).encode('utf-8')
+        return svg_bytes[:end] + group_open + nodes + b'  </g>\n' + svg_bytes[end:]
+
+    # Existing group must be the last element and contain only <text> children
+    group_body = svg_bytes[group_start + len(_AUTO_TAGS_GROUP_OPEN):end]
+    group_end = group_body.rfind(b'</g>')
+    if (group_end == -1 or group_body[group_end + len(b'</g>'):].strip() or
+            group_body.count(b'</g>') != 1 or b'<g' in group_body):
+        return None
+    group_end += group_start + len(_AUTO_TAGS_GROUP_OPEN)
+
+    # Insert at the start of the </g> line to keep the indentation tidy
+    line_start = svg_bytes.rfind(b'\n', group_start, group_end) + 1
+    if line_start and not svg_bytes[line_start:group_end].strip():
+        group_end = line_start
+
+    return svg_bytes[:group_end] + nodes + svg_bytes[group_end:]
+
+
+def _json_default(obj):
+    """Convert numpy values from OCR results into JSON-serializable types"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _atomic_write(path: str, data: bytes):
+    """Write bytes to path via a temp file and os.replace so readers never see a partial file"""
+    # A unique temp name (created exclusively, so the umask still applies) keeps
+    # concurrent writers to the same path from clobbering each other's temp file
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _config_mtime_ns(config_path: Optional[str]) -> int:
+    """Get config file mtime in nanoseconds (0 if no config) for use as a cache key"""
+    if not config_path:
+        return 0
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=16)
+def _load_and_merge_style(config_path: Optional[str], mtime_ns: int) -> Mapping:
+    """
+    Load config and merge SVG style with defaults, cached per config path + mtime
+
+    Batch runs over many images sharing one config.json reuse a single parsed
+    style object. The result is read-only; copy it before modifying.
+    """
+    config = SVGOverlayGenerator.load_config(config_path) if config_path else None
+    return _freeze(SVGOverlayGenerator.get_style_config(config))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_and_merge_table(config_path: Optional[str], mtime_ns: int) -> Optional[Mapping]:
+    """Load config and merge unmapped table settings with defaults, cached per config path + mtime"""
+    config = SVGOverlayGenerator.load_config(config_path) if config_path else None
+    return _freeze(SVGOverlayGenerator.get_table_config(config))
@@ -2,27 +2,310 @@
 Device graphics widget for displaying and annotating device images
 """
 
-import sys
 import os
+import json
 import logging
+import platform
 import re
+import subprocess
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QComboBox, QPushButton, QGraphicsView, QGraphicsScene,
-                              QGraphicsPixmapItem, QGraphicsTextItem, QGraphicsRectItem,
-                              QFileDialog, QMessageBox)
-from PyQt6.QtGui import QPixmap, QPainter, QFont, QColor, QPen, QBrush, QImage, QPdfWriter, QPageLayout, QPageSize
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+                              QGraphicsPixmapItem, QGraphicsTextItem, QGraphicsSimpleTextItem,
+                              QGraphicsItem, QGraphicsItemGroup, QGraphicsLineItem, QGraphicsRectItem,
+                              QFileDialog, QMessageBox, QApplication)
+from PyQt6.QtGui import (QPixmap, QPixmapCache, QPainter, QFont, QFontMetricsF, QColor, QPen, QBrush, QImage,
+                         QImageWriter, QPdfWriter, QPageLayout, QPageSize)
+from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal, QObject, QRunnable, QSignalBlocker, QThreadPool
+
+# Application modules resolve from src/, which the entry point (src/main.py /
+# gui.main_window) already puts on sys.path; no path manipulation happens here
 from graphics.template_manager import TemplateManager, DeviceTemplate
 from models.profile_model import ControlProfile, Device, ActionBinding
 from parser.label_generator import LabelGenerator
-from utils.device_splitter import is_vkb_with_sem, get_base_stick_name, get_friendly_device_name
+from utils.device_splitter import (is_vkb_with_sem, get_base_stick_name, get_friendly_device_name,
+                                   extract_button_number)
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, faster drop-in for parsing mapping files
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# lxml keeps the tree in libxml2 and iterates it in C; ElementTree is the fallback
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+# OpenGL viewport is optional; builds without QtOpenGLWidgets keep the raster viewport
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+# Room for several decoded multi-MB device images (limit is in KB)
+QPixmapCache.setCacheLimit(64 * 1024)
+
+# Qt scales PNG compression 0-100 onto zlib levels 0-9; 11-20 selects level 1
+_PNG_FAST_COMPRESSION = 15
+
+_SVG_NS = '{http://www.w3.org/2000/svg}'
+
+# Canonical hat input like "hat1up" (see _canonicalize_input), capturing the direction
+_HAT_RE = re.compile(r'hat\d+(\w+)')
+# Template tag like "{{ Button 1 }}", capturing its content
+_TAG_RE = re.compile(r'\{\{\s*([^}]+)\s*\}\}')
+# Text left as a bare "Button N" means the button has no binding
+_BUTTON_RE = re.compile(r'^Button\s+\d+$')
+# Input code prefix (before the instance number) -> Device.device_type
+_INPUT_PREFIX_TYPES = {'js': 'joystick', 'kb': 'keyboard', 'mo': 'mouse'}
+
+
+class _SvgRect(NamedTuple):
+    """Pre-converted attributes of an overlay <rect>"""
+    x: float
+    y: float
+    width: float
+    height: float
+    fill: str
+    fill_opacity: float
+    stroke: str
+    stroke_opacity: float
+    stroke_width: float
+
+
+class _SvgLine(NamedTuple):
+    """Pre-converted attributes of an overlay <line>"""
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    stroke: str
+    stroke_width: float
+
+
+class _SvgText(NamedTuple):
+    """Pre-converted attributes of an overlay <text>, with its raw (untagged) lines"""
+    x: float
+    y: float
+    font_family: str
+    font_size: int
+    fill: str
+    text_anchor: str
+    font_weight: str
+    max_width: float
+    max_height: float
+    lines: Tuple[str, ...]  # One entry per <tspan>, or the element text
+    multiline: bool
+    in_unmapped_table: bool  # Inside the <g id="unmapped-table"> fallback table
+
+
+class _ParsedOverlay(NamedTuple):
+    """Overlay elements bucketed by kind, in document order"""
+    rects: List[_SvgRect]
+    lines: List[_SvgLine]
+    texts: List[_SvgText]
+
+
+def _parse_overlay(svg_content: bytes) -> _ParsedOverlay:
+    """
+    Parse an SVG overlay into plain tuples in a single tree walk
+
+    Template tags are left in place so the result can be reused for any
+    bindings; they are substituted per text line at render time.
+
+    Args:
+        svg_content: Raw SVG document
+
+    Returns:
+        Bucketed rect, line and text records
+    """
+    root = ET.fromstring(svg_content)
+    rect_tag, line_tag, text_tag = _SVG_NS + 'rect', _SVG_NS + 'line', _SVG_NS + 'text'
+    tspan_tag = _SVG_NS + 'tspan'
+
+    if _HAS_LXML:
+        get_parent = ET._Element.getparent
+    else:
+        # ElementTree has no parent axis, so build a parent map once for ancestry checks
+        get_parent = {child: parent for parent in root.iter() for child in parent}.get
+    in_table_memo: Dict[ET.Element, bool] = {}
+
+    def in_unmapped_table(elem: ET.Element) -> bool:
+        """Whether elem is inside the unmapped-table group, memoized per ancestor"""
+        path = []
+        node = get_parent(elem)
+        result = False
+        while node is not None:
+            cached = in_table_memo.get(node)
+            if cached is not None:
+                result = cached
+                break
+            path.append(node)
+            if node.get('id') == 'unmapped-table':
+                result = True
+                break
+            node = get_parent(node)
+
+        # Every node walked shares the answer (all are descendants of the hit, or none are)
+        for node in path:
+            in_table_memo[node] = result
+        return result
+
+    # lxml filters by tag in C (in document order); ElementTree's iter() takes a single
+    # tag, so it walks everything. Compare tags with ==: lxml builds a fresh tag string
+    # on every access, so an identity check would never match
+    if _HAS_LXML:
+        elements = root.iter(rect_tag, line_tag, text_tag)
+    else:
+        elements = root.iter()
+
+    rects, lines, texts = [], [], []
+    for elem in elements:
+        tag = elem.tag
+        if tag == rect_tag:
+            get = elem.attrib.get
+            rects.append(_SvgRect(
+                float(get('x', 0)),
+                float(get('y', 0)),
+                float(get('width', 0)),
+                float(get('height', 0)),
+                get('fill', 'white'),
+                # Support both old 'opacity' and new 'fill-opacity' attributes
+                float(get('fill-opacity', get('opacity', 1.0))),
+                get('stroke', 'none'),
+                float(get('stroke-opacity', 1.0)),
+                float(get('stroke-width', 0)),
+            ))
+        elif tag == line_tag:
+            get = elem.attrib.get
+            lines.append(_SvgLine(
+                float(get('x1', 0)),
+                float(get('y1', 0)),
+                float(get('x2', 0)),
+                float(get('y2', 0)),
+                get('stroke', 'black'),
+                float(get('stroke-width', 1)),
+            ))
+        elif tag == text_tag:
+            get = elem.attrib.get
+            # tspan elements carry multi-line text from config
+            tspans = list(elem.iter(tspan_tag))
+            if tspans:
+                text_lines = tuple(tspan.text or '' for tspan in tspans)
+            else:
+                text_lines = (elem.text or '',)
+
+            texts.append(_SvgText(
+                float(get('x', 0)),
+                float(get('y', 0)),
+                get('font-family', 'Arial'),
+                int(get('font-size', 10)),
+                get('fill', 'black'),
+                get('text-anchor', 'start'),
+                get('font-weight', 'normal'),
+                float(get('data-max-width', 0)),
+                float(get('data-max-height', 0)),
+                text_lines,
+                bool(tspans),
+                in_unmapped_table(elem),
+            ))
+
+    return _ParsedOverlay(rects, lines, texts)
+
+
+def _read_overlay(overlay_path: str) -> Tuple[int, _ParsedOverlay]:
+    """
+    Read and parse an SVG overlay file
+
+    Args:
+        overlay_path: Path to SVG overlay
+
+    Returns:
+        (mtime_ns, parsed overlay) for caching
+    """
+    mtime_ns = os.stat(overlay_path).st_mtime_ns
+    with open(overlay_path, 'rb') as f:
+        return mtime_ns, _parse_overlay(f.read())
+
+
+class _OverlayParseSignals(QObject):
+    """Signals for OverlayParseJob (QRunnable is not a QObject)"""
+
+    # job id, overlay path, (mtime_ns, parsed overlay) or None on failure
+    finished = pyqtSignal(int, str, object)
+
+
+class OverlayParseJob(QRunnable):
+    """
+    Parse an SVG overlay on a pool thread
+
+    The result is plain tuples only; Qt graphics items are thread-affine and are
+    built by the widget once the result arrives on the UI thread.
+    """
+
+    def __init__(self, job_id: int, overlay_path: str):
+        super().__init__()
+        self.job_id = job_id
+        self.overlay_path = overlay_path
+        self.signals = _OverlayParseSignals()
+
+    def run(self):
+        try:
+            result = _read_overlay(self.overlay_path)
+        except Exception as e:
+            logger.error(f"Error reading SVG overlay: {e}", exc_info=True)
+            result = None
+        self.signals.finished.emit(self.job_id, self.overlay_path, result)
+
+
+def _canonicalize_input(label: str) -> str:
+    """
+    Collapse an input label to the single key used for binding lookups
+
+    Templates spell inputs inconsistently ("Hat 1 Up", "Hat1 up"), so both the
+    bindings map and template tags are reduced to lowercase without whitespace.
+
+    Args:
+        label: Input label or template tag content
+
+    Returns:
+        Canonical key, e.g. "hat1up" or "button3"
+    """
+    return ''.join(label.split()).lower()
+
+
+def _make_text_item(text: str, color: QColor, *, multiline: bool = False) -> QGraphicsItem:
+    """
+    Create a scene text item
+
+    Plain single-line text uses QGraphicsSimpleTextItem, which has no
+    QTextDocument behind it; only multi-line text gets a QGraphicsTextItem.
+
+    Args:
+        text: Text to display
+        color: Text color
+        multiline: Whether the text is joined tspan lines
+
+    Returns:
+        Text item (not yet added to a scene)
+    """
+    if multiline or '<br/>' in text:
+        item = QGraphicsTextItem()
+        item.setPlainText(text)
+        item.setDefaultTextColor(color)
+    else:
+        item = QGraphicsSimpleTextItem(text)
+        item.setBrush(QBrush(color))
+    return item
+
 
 class ResizableGraphicsView(QGraphicsView):
     """Custom QGraphicsView that re-fits content on resize"""
@@ -53,6 +336,31 @@ class DeviceGraphicsWidget(QWidget):
         self.current_template: DeviceTemplate = None
         self.current_device_name: str = None  # Actual device name to display (may differ from current_device.product_name for split devices)
 
+        # Parsed overlays keyed by path: (mtime_ns, parsed overlay)
+        self._overlay_cache: Dict[str, Tuple[int, _ParsedOverlay]] = {}
+        # Bumped on every device load so late parse results for a previous device are dropped
+        self._overlay_job_id = 0
+
+        # Per-profile binding caches, rebuilt by load_profile / invalidate_bindings_cache
+        # (device_type, instance) -> [(action map name, binding, button number or None)]
+        self._bindings_index: Dict[Tuple[str, int], List[Tuple[str, ActionBinding, Optional[int]]]] = {}
+        self._label_maps: Dict[Tuple[int, str], Dict[str, str]] = {}
+        # Generated labels keyed by id(binding); bindings stay alive with the profile
+        self._input_labels: Dict[int, str] = {}
+        self._action_labels: Dict[int, str] = {}
+
+        # Detailed callout mappings keyed by path: (mtime_ns, mapping)
+        self._mapping_cache: Dict[str, Tuple[int, Optional[dict]]] = {}
+
+        # Font metrics keyed by (family, point size, bold)
+        self._fm_cache: Dict[Tuple[str, int, bool], QFontMetricsF] = {}
+
+        # Qt value types reused across overlay elements, keyed by constructor arguments
+        self._qcolor_cache: Dict[str, QColor] = {}
+        self._qfont_cache: Dict[Tuple[str, int, bool], QFont] = {}
+        self._qbrush_cache: Dict[Tuple[str, float], QBrush] = {}
+        self._qpen_cache: Dict[Tuple[Optional[str], float, float], QPen] = {}
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -72,10 +380,13 @@ class DeviceGraphicsWidget(QWidget):
 
         # Graphics view
         self.scene = QGraphicsScene()
+        # Annotation scenes are static and never hit-tested at scale, so skip the BSP index
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.view = ResizableGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self._setup_gl_viewport()
         layout.addWidget(self.view)
 
         # Status label
@@ -83,9 +394,23 @@ class DeviceGraphicsWidget(QWidget):
         self.status_label.setStyleSheet("color: #666; font-size: 11px;")
         layout.addWidget(self.status_label)
 
+    def _setup_gl_viewport(self):
+        """Rasterize the view with OpenGL when available, keeping the raster viewport otherwise"""
+        # Headless platforms have no GL context to offer
+        if QOpenGLWidget is None or QApplication.platformName() in ('offscreen', 'minimal'):
+            return
+
+        try:
+            self.view.setViewport(QOpenGLWidget())
+            # GL viewports must repaint in full; partial updates leave stale regions
+            self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        except Exception as e:
+            logger.warning(f"OpenGL viewport unavailable, using raster: {e}")
+
     def load_profile(self, profile: ControlProfile):
         """Load a profile and populate device list"""
         self.current_profile = profile
+        self.invalidate_bindings_cache()
         self.device_combo.clear()
 
         if not profile:
@@ -137,6 +462,121 @@ class DeviceGraphicsWidget(QWidget):
         else:
             self.status_label.setText(f"Found {self.device_combo.count()} device(s)")
 
+    def invalidate_bindings_cache(self):
+        """Rebuild cached per-device bindings; call after the profile's bindings change"""
+        self._label_maps.clear()
+        self._input_labels.clear()
+        self._action_labels.clear()
+        self._bindings_index = {}
+
+        if not self.current_profile:
+            return
+
+        # Single pass over the profile, indexing bindings by the device their prefix
+        # names (e.g. "js2_" -> ('joystick', 2)) and parsing button numbers once
+        for action_map in self.current_profile.action_maps:
+            for binding in action_map.actions:
+                prefix, sep, _ = binding.input_code.partition('_')
+                device_type = _INPUT_PREFIX_TYPES.get(prefix[:2])
+                if not sep or device_type is None or not prefix[2:].isdigit():
+                    continue
+
+                button_num = extract_button_number(binding.input_code) if device_type == 'joystick' else None
+                self._bindings_index.setdefault((device_type, int(prefix[2:])), []).append(
+                    (action_map.name, binding, button_num))
+
+    def _input_label(self, binding: ActionBinding) -> str:
+        """Memoized LabelGenerator.generate_input_label for a binding"""
+        label = self._input_labels.get(id(binding))
+        if label is None:
+            label = LabelGenerator.generate_input_label(binding.input_code)
+            self._input_labels[id(binding)] = label
+        return label
+
+    def _action_label(self, binding: ActionBinding) -> str:
+        """Memoized LabelGenerator.get_action_label for a binding"""
+        label = self._action_labels.get(id(binding))
+        if label is None:
+            label = LabelGenerator.get_action_label(binding.action_name, binding)
+            self._action_labels[id(binding)] = label
+        return label
+
+    def _font_metrics(self, font: QFont) -> QFontMetricsF:
+        """Cached QFontMetricsF for a font"""
+        key = (font.family(), font.pointSize(), font.bold())
+        fm = self._fm_cache.get(key)
+        if fm is None:
+            fm = QFontMetricsF(font)
+            self._fm_cache[key] = fm
+        return fm
+
+    def _color(self, name: str, alpha: Optional[float] = None) -> QColor:
+        """
+        Cached QColor for an SVG color string
+
+        Args:
+            name: Color name or hex string
+            alpha: Alpha in 0..1 to apply, or None to keep the parsed alpha
+
+        Returns:
+            The shared color, or a copy when a different alpha is applied
+        """
+        color = self._qcolor_cache.get(name)
+        if color is None:
+            color = QColor(name)
+            self._qcolor_cache[name] = color
+
+        # Only clone when the alpha actually changes; the common opaque case shares the cached color
+        if alpha is None or (alpha >= 1.0 and color.alpha() == 255):
+            return color
+        color = QColor(color)
+        color.setAlphaF(alpha)
+        return color
+
+    def _font(self, family: str, size: int, bold: bool = False) -> QFont:
+        """Cached QFont; callers must not modify the returned font"""
+        key = (family, size, bold)
+        font = self._qfont_cache.get(key)
+        if font is None:
+            font = QFont(family, size)
+            if bold:
+                font.setBold(True)
+            self._qfont_cache[key] = font
+        return font
+
+    def _brush(self, fill: str, alpha: float) -> QBrush:
+        """Cached solid brush for a fill color and opacity"""
+        key = (fill, alpha)
+        brush = self._qbrush_cache.get(key)
+        if brush is None:
+            brush = QBrush(self._color(fill, alpha))
+            self._qbrush_cache[key] = brush
+        return brush
+
+    def _pen(self, stroke: Optional[str], alpha: Optional[float] = None, width: float = 1.0) -> QPen:
+        """Cached pen for a stroke color, opacity and width; a stroke of None gives NoPen"""
+        key = (stroke, alpha, width)
+        pen = self._qpen_cache.get(key)
+        if pen is None:
+            if stroke is None:
+                pen = QPen(Qt.PenStyle.NoPen)
+            else:
+                pen = QPen(self._color(stroke, alpha))
+                pen.setWidthF(width)
+            self._qpen_cache[key] = pen
+        return pen
+
+    def _text_size(self, text_item: QGraphicsItem, text: str, font: QFont) -> Tuple[float, float]:
+        """Width and height of text in font, from font metrics where no layout is needed"""
+        if isinstance(text_item, QGraphicsSimpleTextItem):
+            fm = self._font_metrics(font)
+            return fm.horizontalAdvance(text), fm.height()
+
+        # Multi-line document items still need a real layout
+        text_item.setFont(font)
+        rect = text_item.boundingRect()
+        return rect.width(), rect.height()
+
     def select_device_by_name(self, device_name: str) -> bool:
         """
         Select a device in the combo box by its display name.
@@ -184,6 +624,8 @@ class DeviceGraphicsWidget(QWidget):
         if not self.current_device or not self.current_device_name:
             return
 
+        self._overlay_job_id += 1
+
         # Find template for this device (use current_device_name for split devices)
         template = self.template_manager.find_template(self.current_device_name)
 
@@ -205,37 +647,71 @@ class DeviceGraphicsWidget(QWidget):
         # Clear scene
         self.scene.clear()
 
-        # Load and display device image
-        pixmap = QPixmap(template.image_path)
+        # Load and display device image, decoding it only on the first visit
+        pixmap = self._load_pixmap(template.image_path)
 
-        if pixmap.isNull():
+        if pixmap is None:
             self.status_label.setText(f"Failed to load image: {template.image_path}")
             self.export_available_changed.emit(False)
             return
 
         # Add image to scene
         pixmap_item = QGraphicsPixmapItem(pixmap)
+        # Resample smoothly once and keep the scaled result in a device-space cache,
+        # so pans and resizes blit it instead of redrawing the full-size image
+        pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        pixmap_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.scene.addItem(pixmap_item)
 
         # Add annotations
-        self.add_annotations()
+        overlay_pending = self.add_annotations()
 
         # Fit view to scene
         self.view.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
 
+        if overlay_pending:
+            # _on_overlay_parsed finishes the load once the overlay is rendered
+            self.status_label.setText(f"Loading overlay: {template.name}...")
+            self.export_available_changed.emit(False)
+            return
+
         self.status_label.setText(f"Loaded: {template.name}")
         self.export_available_changed.emit(True)
 
-    def add_annotations(self):
-        """Add control annotations to the device graphic"""
+    @staticmethod
+    def _load_pixmap(image_path: str) -> Optional[QPixmap]:
+        """
+        Load a device image through QPixmapCache, keyed by path and mtime
+
+        Args:
+            image_path: Path to template image
+
+        Returns:
+            Pixmap (implicitly shared with the cache), or None if it could not be loaded
+        """
+        key = f"{image_path}:{os.stat(image_path).st_mtime_ns}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(image_path)
+            if pixmap.isNull():
+                return None
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def add_annotations(self) -> bool:
+        """
+        Add control annotations to the device graphic
+
+        Returns:
+            True if the SVG overlay is still being parsed and will be added later
+        """
         if not self.current_device or not self.current_profile:
-            return
+            return False
 
         # Check if template has SVG overlay
         if self.current_template and self.current_template.overlay_path:
             if os.path.exists(self.current_template.overlay_path):
-                self.add_svg_overlay_annotations()
-                return
+                return self.add_svg_overlay_annotations()
 
         # Fall back to JSON mapping or legend
         mapping = self.load_detailed_mapping()
@@ -245,25 +721,69 @@ class DeviceGraphicsWidget(QWidget):
             device_bindings = self.get_device_bindings()
             if device_bindings:
                 self.add_binding_legend(device_bindings)
+        return False
 
-    def add_svg_overlay_annotations(self):
-        """Add annotations using SVG overlay with template tags"""
+    def add_svg_overlay_annotations(self) -> bool:
+        """
+        Add annotations using SVG overlay with template tags
+
+        Returns:
+            True if the overlay is being parsed on the thread pool and will be added later
+        """
         if not self.current_template or not self.current_template.overlay_path:
+            return False
+
+        overlay_path = self.current_template.overlay_path
+        overlay = self.get_cached_overlay(overlay_path)
+        if overlay is not None:
+            # Render the overlay, passing the bindings map to substitute tags and filter unmapped buttons
+            self.render_svg_overlay(overlay, self.get_bindings_map())
+            return False
+
+        # Parse off the UI thread; _on_overlay_parsed renders the result
+        job = OverlayParseJob(self._overlay_job_id, overlay_path)
+        job.signals.finished.connect(self._on_overlay_parsed)
+        QThreadPool.globalInstance().start(job)
+        return True
+
+    def _on_overlay_parsed(self, job_id: int, overlay_path: str, result: Optional[Tuple[int, _ParsedOverlay]]):
+        """Cache a parsed overlay and, if its device is still displayed, render it and finish the load"""
+        if result is not None:
+            self._overlay_cache[overlay_path] = result
+
+        if job_id != self._overlay_job_id:
             return
 
-        # Read SVG file
-        try:
-            with open(self.current_template.overlay_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
-        except Exception as e:
-            logger.error(f"Error reading SVG overlay: {e}", exc_info=True)
+        if result is None:
+            self.status_label.setText(f"Failed to load overlay: {overlay_path}")
+            self.export_available_changed.emit(False)
             return
 
+        self.render_svg_overlay(result[1], self.get_bindings_map())
+        self.view.fitInView(self.scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+
+        self.status_label.setText(f"Loaded: {self.current_template.name}")
+        self.export_available_changed.emit(True)
+
+    def get_bindings_map(self) -> Dict[str, str]:
+        """
+        Get the input label -> combined action label map for the current device
+
+        The map (including numberless hat keys) is built once per device and cached
+        until the profile is reloaded or invalidate_bindings_cache() is called.
+
+        Returns:
+            Mapping of canonical input key (see _canonicalize_input) to display label
+        """
+        key = (self.current_device.instance, self.current_device_name)
+        bindings_map = self._label_maps.get(key)
+        if bindings_map is not None:
+            return bindings_map
+
         # Get all bindings for this device
         device_bindings = self.get_device_bindings()
 
         # First, group bindings by input_code to handle multiple actions per button
-        from collections import defaultdict
         grouped_bindings = defaultdict(list)
 
         for action_map_name, binding in device_bindings:
@@ -273,7 +793,7 @@ class DeviceGraphicsWidget(QWidget):
                 continue
 
             # Get the human-readable input label (e.g., "Button 3", "Hat 1 Up")
-            input_label = LabelGenerator.generate_input_label(binding.input_code)
+            input_label = self._input_label(binding)
             # Remove device prefix if present (e.g., "Joystick 1: Button 3" -> "Button 3")
             if ': ' in input_label:
                 input_label = input_label.split(': ', 1)[1]
@@ -282,15 +802,15 @@ class DeviceGraphicsWidget(QWidget):
             if not input_label or not input_label.strip():
                 continue
 
-            grouped_bindings[input_label].append((action_map_name, binding))
+            grouped_bindings[_canonicalize_input(input_label)].append((action_map_name, binding))
 
-        # Create mapping from input labels to action labels
+        # Create mapping from canonical input keys to action labels
         bindings_map = {}
-        for input_label, bindings in grouped_bindings.items():
+        for input_key, bindings in grouped_bindings.items():
             # Get action labels for all bindings on this input
             action_labels = []
             for action_map_name, binding in bindings:
-                action_label = LabelGenerator.get_action_label(binding.action_name, binding)
+                action_label = self._action_label(binding)
                 action_labels.append(action_label)
 
             # Remove duplicates while preserving order (e.g., when multiple actions have same custom label)
@@ -299,115 +819,91 @@ class DeviceGraphicsWidget(QWidget):
             # Join multiple actions with slash separator (single line)
             combined_label = ' / '.join(unique_labels)
 
-            # Store mapping - use the original label as the primary key
-            bindings_map[input_label] = combined_label
+            # "Hat 1 Up" and "Hat1 up" share the canonical key "hat1up"
+            bindings_map[input_key] = combined_label
 
-            # For hat buttons, also store under template-friendly formats
-            # Templates may use different formats:
-            # - "Hat up", "Hat down" (no number, lowercase) - used by right stick
-            # - "Hat1 up", "Hat1 down" (no space, lowercase) - used by left stick
-            # So we store the action under ALL possible formats the templates might use
-            hat_match = re.match(r'Hat\s+(\d+)\s+(\w+)', input_label)
+            # Some templates (e.g. the right stick) write hats without a number ("Hat up"),
+            # so hats are also stored under the numberless key
+            hat_match = _HAT_RE.match(input_key)
             if hat_match:
-                hat_num = hat_match.group(1)
-                direction = hat_match.group(2).lower()
-                # Format 1: "Hat up" (no number, lowercase direction)
-                bindings_map[f"Hat {direction}"] = combined_label
-                # Format 2: "Hat1 up" (no space between Hat and number, lowercase direction)
-                bindings_map[f"Hat{hat_num} {direction}"] = combined_label
-
-        # Replace template tags in SVG with actual bindings
-        def replace_tag(match):
-            tag_content = match.group(1).strip()
-            # Look up the binding for this input
-            return bindings_map.get(tag_content, tag_content)  # Keep original if not found
+                bindings_map[f"hat{hat_match.group(1)}"] = combined_label
 
-        # Replace all {{...}} tags
-        processed_svg = re.sub(r'\{\{\s*([^}]+)\s*\}\}', replace_tag, svg_content)
+        self._label_maps[key] = bindings_map
+        return bindings_map
 
-        # Render the processed SVG, passing the bindings map to filter unmapped buttons
-        self.render_svg_overlay(processed_svg, bindings_map)
+    def get_cached_overlay(self, overlay_path: str) -> Optional[_ParsedOverlay]:
+        """
+        Get the parsed overlay for a path if it is cached and the file is unchanged
+
+        Args:
+            overlay_path: Path to SVG overlay
+
+        Returns:
+            Parsed overlay, or None if it has to be (re)parsed
+        """
+        cached = self._overlay_cache.get(overlay_path)
+        if cached is None:
+            return None
 
-    def render_svg_overlay(self, svg_content: str, bindings_map: dict = None):
-        """Render processed SVG content as overlay on the scene"""
-        # Parse SVG XML to extract elements and render them
         try:
-            import xml.etree.ElementTree as ET
-            import re
-            root = ET.fromstring(svg_content)
-
-            # Find and render rectangle elements (for table backgrounds)
-            for rect_elem in root.findall('.//{http://www.w3.org/2000/svg}rect'):
-                x = float(rect_elem.get('x', 0))
-                y = float(rect_elem.get('y', 0))
-                width = float(rect_elem.get('width', 0))
-                height = float(rect_elem.get('height', 0))
-                fill = rect_elem.get('fill', 'white')
+            mtime_ns = os.stat(overlay_path).st_mtime_ns
+        except OSError:
+            return None
+        return cached[1] if cached[0] == mtime_ns else None
 
-                # Support both old 'opacity' and new 'fill-opacity' attributes
-                fill_opacity = float(rect_elem.get('fill-opacity', rect_elem.get('opacity', 1.0)))
-                stroke_opacity = float(rect_elem.get('stroke-opacity', 1.0))
+    def render_svg_overlay(self, overlay: _ParsedOverlay, bindings_map: dict = None):
+        """Render a parsed SVG overlay on the scene, replacing template tags with bindings"""
+        lookup = bindings_map if bindings_map is not None else {}
 
-                stroke = rect_elem.get('stroke', 'none')
-                stroke_width = float(rect_elem.get('stroke-width', 0))
+        # Replace template tags with actual bindings
+        def replace_tag(match):
+            tag_content = match.group(1).strip()
+            # Look up the binding for this input
+            return lookup.get(_canonicalize_input(tag_content), tag_content)  # Keep original if not found
 
+        # Parent every overlay item to one contentless group so the scene takes a
+        # single insertion instead of one per element
+        group = QGraphicsItemGroup()
+        group.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+
+        try:
+            # Render rectangle elements (for table backgrounds)
+            for x, y, width, height, fill, fill_opacity, stroke, stroke_opacity, stroke_width in overlay.rects:
                 rect_item = QGraphicsRectItem(x, y, width, height)
 
                 # Set fill with opacity
-                fill_color = QColor(fill)
-                fill_color.setAlphaF(fill_opacity)
-                rect_item.setBrush(QBrush(fill_color))
+                rect_item.setBrush(self._brush(fill, fill_opacity))
 
                 if stroke != 'none':
-                    stroke_color = QColor(stroke)
-                    stroke_color.setAlphaF(stroke_opacity)
-                    pen = QPen(stroke_color)
-                    pen.setWidthF(stroke_width)
-                    rect_item.setPen(pen)
+                    rect_item.setPen(self._pen(stroke, stroke_opacity, stroke_width))
                 else:
-                    rect_item.setPen(QPen(Qt.PenStyle.NoPen))
-
-                self.scene.addItem(rect_item)
-
-            # Find and render line elements (for table borders)
-            for line_elem in root.findall('.//{http://www.w3.org/2000/svg}line'):
-                x1 = float(line_elem.get('x1', 0))
-                y1 = float(line_elem.get('y1', 0))
-                x2 = float(line_elem.get('x2', 0))
-                y2 = float(line_elem.get('y2', 0))
-                stroke = line_elem.get('stroke', 'black')
-                stroke_width = float(line_elem.get('stroke-width', 1))
-
-                pen = QPen(QColor(stroke))
-                pen.setWidthF(stroke_width)
-
-                line_item = self.scene.addLine(x1, y1, x2, y2, pen)
-
-            # Find all text elements
-            for text_elem in root.findall('.//{http://www.w3.org/2000/svg}text'):
-                # Extract attributes
-                x = float(text_elem.get('x', 0))
-                y = float(text_elem.get('y', 0))
-                font_family = text_elem.get('font-family', 'Arial')
-                font_size = int(text_elem.get('font-size', 10))
-                fill = text_elem.get('fill', 'black')
-                text_anchor = text_elem.get('text-anchor', 'start')
-                font_weight = text_elem.get('font-weight', 'normal')
-                stroke_attr = text_elem.get('stroke')
-                stroke_width_attr = text_elem.get('stroke-width', '0')
-
-                # Get max dimensions from data attributes
-                max_width = float(text_elem.get('data-max-width', 0))
-                max_height = float(text_elem.get('data-max-height', 0))
-
-                # Check for tspan elements (multi-line text from config)
-                tspan_elems = text_elem.findall('.//{http://www.w3.org/2000/svg}tspan')
-
-                if tspan_elems:
+                    rect_item.setPen(self._pen(None))
+
+                rect_item.setParentItem(group)
+
+            # Render line elements (for table borders)
+            for x1, y1, x2, y2, stroke, stroke_width in overlay.lines:
+                line_item = QGraphicsLineItem(x1, y1, x2, y2, group)
+                line_item.setPen(self._pen(stroke, width=stroke_width))
+
+            # Render text elements
+            for text in overlay.texts:
+                x, y = text.x, text.y
+                font_family = text.font_family
+                font_size = text.font_size
+                fill = text.fill
+                text_anchor = text.text_anchor
+                font_weight = text.font_weight
+
+                # Max dimensions from data attributes
+                max_width = text.max_width
+                max_height = text.max_height
+
+                if text.multiline:
                     # Multi-line text using tspan elements
                     wrapped_lines = []
-                    for tspan in tspan_elems:
-                        tspan_text = tspan.text or ''
+                    for raw_line in text.lines:
+                        tspan_text = _TAG_RE.sub(replace_tag, raw_line)
                         if tspan_text.strip():
                             wrapped_lines.append(tspan_text)
 
@@ -417,13 +913,13 @@ class DeviceGraphicsWidget(QWidget):
 
                     # Check first line for unmapped button pattern
                     first_line = wrapped_lines[0].strip() if wrapped_lines else ''
-                    if bindings_map is not None and re.match(r'^Button\s+\d+$', first_line):
+                    if bindings_map is not None and _BUTTON_RE.match(first_line):
                         continue
 
                     wrapped_text = '<br/>'.join(wrapped_lines)
                 else:
                     # Single-line text
-                    text_content = text_elem.text or ''
+                    text_content = _TAG_RE.sub(replace_tag, text.lines[0])
 
                     # Skip empty text
                     if not text_content.strip():
@@ -431,74 +927,54 @@ class DeviceGraphicsWidget(QWidget):
 
                     # Skip unmapped buttons (those that still have "Button X" pattern)
                     # UNLESS we're in a table (bindings_map will still process table rows)
-                    parent = text_elem.find('..')
-                    in_table = False
-                    if parent is not None:
-                        # Check if parent or ancestor is the unmapped-table group
-                        current = text_elem
-                        for _ in range(3):  # Check up to 3 levels up
-                            parent_elem = root.find(f".//*[@id='unmapped-table']")
-                            if parent_elem is not None and current in list(parent_elem.iter()):
-                                in_table = True
-                                break
-                            # Move up (this is approximate - XML doesn't have parent refs)
-                            break
-
-                    # For table text, don't skip unmapped buttons
-                    if not in_table and bindings_map is not None:
-                        if re.match(r'^Button\s+\d+$', text_content.strip()):
+                    if not text.in_unmapped_table and bindings_map is not None:
+                        if _BUTTON_RE.match(text_content.strip()):
                             continue
 
                     wrapped_text = text_content
 
                 # Create Qt text item
-                text_item = QGraphicsTextItem()
-                text_item.setPlainText(wrapped_text)
+                text_item = _make_text_item(wrapped_text, self._color(fill), multiline=text.multiline)
 
                 # Set font
-                font = QFont(font_family, font_size)
-                if font_weight == 'bold':
-                    font.setBold(True)
-                text_item.setFont(font)
+                bold = font_weight == 'bold'
+                font = self._font(font_family, font_size, bold)
 
                 # Auto-scale font if text is too wide/tall and max dimensions are specified
+                # (measured from font metrics before the item is laid out)
                 if max_width > 0 and max_height > 0:
-                    current_width = text_item.boundingRect().width()
-                    current_height = text_item.boundingRect().height()
+                    current_width, current_height = self._text_size(text_item, wrapped_text, font)
 
                     # Scale down font if text exceeds max dimensions
                     if current_width > max_width or current_height > max_height:
                         scale_factor = min(max_width / current_width, max_height / current_height)
                         new_font_size = max(6, int(font_size * scale_factor * 0.9))  # 0.9 for padding
-                        font = QFont(font_family, new_font_size)
-                        if font_weight == 'bold':
-                            font.setBold(True)
-                        text_item.setFont(font)
+                        font = self._font(font_family, new_font_size, bold)
 
-                # Set color
-                color = QColor(fill)
-                text_item.setDefaultTextColor(color)
+                text_item.setFont(font)
+                text_width, text_height = self._text_size(text_item, wrapped_text, font)
 
                 # Set transparent background (Qt default, but explicitly set)
-                text_item.setFlag(QGraphicsTextItem.GraphicsItemFlag.ItemIsSelectable, False)
+                text_item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, False)
 
                 # Adjust position based on text-anchor
                 if text_anchor == 'middle':
-                    text_width = text_item.boundingRect().width()
                     x -= text_width / 2
                 elif text_anchor == 'end':
-                    text_width = text_item.boundingRect().width()
                     x -= text_width
 
                 # SVG y is baseline, Qt y is top, so adjust
-                y -= text_item.boundingRect().height() * 0.75
+                y -= text_height * 0.75
 
                 text_item.setPos(x, y)
-                self.scene.addItem(text_item)
+                text_item.setParentItem(group)
 
         except Exception as e:
             logger.error(f"Error rendering SVG overlay: {e}", exc_info=True)
 
+        with QSignalBlocker(self.scene):
+            self.scene.addItem(group)
+
     def load_detailed_mapping(self) -> dict:
         """Load detailed callout mapping for current template"""
         if not self.current_template:
@@ -508,16 +984,24 @@ class DeviceGraphicsWidget(QWidget):
         template_id = self.current_template.id
         mapping_path = os.path.join(self.templates_dir, f"{template_id}.json")
 
-        if not os.path.exists(mapping_path):
+        try:
+            mtime_ns = os.stat(mapping_path).st_mtime_ns
+        except OSError:
             return None
 
+        cached = self._mapping_cache.get(mapping_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
-            import json
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(mapping_path, 'rb') as f:
+                mapping = _loads(f.read())
         except Exception as e:
             logger.error(f"Error loading mapping file: {e}", exc_info=True)
-            return None
+            mapping = None
+
+        self._mapping_cache[mapping_path] = (mtime_ns, mapping)
+        return mapping
 
     def add_callout_annotations(self, mapping: dict):
         """Add annotations using detailed callout box mapping"""
@@ -543,7 +1027,7 @@ class DeviceGraphicsWidget(QWidget):
             input_id = callout.get('input')
             if input_id in bindings_dict:
                 action_map_name, binding = bindings_dict[input_id]
-                action_label = LabelGenerator.get_action_label(binding.action_name, binding)
+                action_label = self._action_label(binding)
 
                 # Add text to callout box
                 pos = callout.get('position', {})
@@ -564,7 +1048,7 @@ class DeviceGraphicsWidget(QWidget):
                     hat_input = f"{input_id}_{direction}"
                     if hat_input in bindings_dict:
                         action_map_name, binding = bindings_dict[hat_input]
-                        action_label = LabelGenerator.get_action_label(binding.action_name, binding)
+                        action_label = self._action_label(binding)
 
                         pos = info.get('position', {})
                         self.add_text_to_callout(
@@ -577,29 +1061,29 @@ class DeviceGraphicsWidget(QWidget):
 
     def add_text_to_callout(self, text: str, x: float, y: float, width: float, height: float):
         """Add text to a specific callout box position"""
-        # Create text item
-        text_item = QGraphicsTextItem(text)
-        text_item.setDefaultTextColor(QColor(0, 0, 0))
+        limit = width - 10
 
         # Set font to fit in callout box
-        font = QFont("Arial", 8)
-        text_item.setFont(font)
+        font = self._font("Arial", 8)
+        fm = self._font_metrics(font)
 
         # Truncate if too long
-        if text_item.boundingRect().width() > width - 10:
+        if fm.horizontalAdvance(text) > limit:
             # Try smaller font
-            font = QFont("Arial", 7)
-            text_item.setFont(font)
+            font = self._font("Arial", 7)
+            fm = self._font_metrics(font)
 
-            # Still too long? Truncate
-            if text_item.boundingRect().width() > width - 10:
-                while text_item.boundingRect().width() > width - 10 and len(text) > 5:
-                    text = text[:-4] + "..."
-                    text_item.setPlainText(text)
+            # Still too long? Let Qt elide to the longest prefix that fits
+            if fm.horizontalAdvance(text) > limit and len(text) > 5:
+                text = fm.elidedText(text, Qt.TextElideMode.ElideRight, limit)
+
+        # Create text item
+        text_item = _make_text_item(text, self._color('black'))
+        text_item.setFont(font)
 
         # Center text in callout box
-        text_width = text_item.boundingRect().width()
-        text_height = text_item.boundingRect().height()
+        text_width = fm.horizontalAdvance(text)
+        text_height = fm.height()
 
         centered_x = x + (width - text_width) / 2
         centered_y = y + (height - text_height) / 2
@@ -612,86 +1096,82 @@ class DeviceGraphicsWidget(QWidget):
         if not self.current_device or not self.current_profile or not self.current_device_name:
             return []
 
-        bindings = []
-        device_instance = self.current_device.instance
-        device_type = self.current_device.device_type
+        if self.current_device.device_type != 'joystick':
+            return []
+
+        # Bindings for this device, indexed once per profile load
+        indexed = self._bindings_index.get(('joystick', self.current_device.instance), ())
 
         # Get button range for this template (if it has one)
         template = self.template_manager.find_template(self.current_device_name)
         button_range = template.button_range if template and template.button_range else None
+        if not button_range:
+            # No button range filtering - include all bindings for this device
+            return [(action_map_name, binding) for action_map_name, binding, _ in indexed]
 
-        for action_map in self.current_profile.action_maps:
-            for binding in action_map.actions:
-                # Check if this binding is for this device instance
-                if device_type == 'joystick' and binding.input_code.startswith(f'js{device_instance}_'):
-                    # If we have a button range, filter by it
-                    if button_range:
-                        from utils.device_splitter import extract_button_number
-                        button_num = extract_button_number(binding.input_code)
-
-                        # Only include if button is in range
-                        if button_num is not None:
-                            if button_range[0] <= button_num <= button_range[1]:
-                                bindings.append((action_map.name, binding))
-                        # For non-button inputs (axes, hats), only include for base device (lower button range)
-                        elif button_range[0] == 1:
-                            bindings.append((action_map.name, binding))
-                    else:
-                        # No button range filtering - include all bindings for this device
-                        bindings.append((action_map.name, binding))
+        low, high = button_range
+        bindings = []
+        for action_map_name, binding, button_num in indexed:
+            # Only include if button is in range
+            if button_num is not None:
+                if low <= button_num <= high:
+                    bindings.append((action_map_name, binding))
+            # For non-button inputs (axes, hats), only include for base device (lower button range)
+            elif low == 1:
+                bindings.append((action_map_name, binding))
 
         return bindings
 
     def add_binding_legend(self, bindings: list):
         """Add a legend showing bindings"""
-        # Add a semi-transparent background for legend
         legend_width = 300
         legend_x = self.scene.sceneRect().right() - legend_width - 20
         legend_y = 20
 
-        bg_rect = QGraphicsRectItem(legend_x, legend_y, legend_width, min(len(bindings) * 20 + 40, 400))
+        # Build the binding lines first (limit to first 15 to avoid overflow),
+        # truncating with font metrics rather than a laid-out item per line
+        line_font = QFont("Arial", 9)
+        fm = self._font_metrics(line_font)
+        lines = []
+        for action_map_name, binding in bindings[:15]:
+            action_label = self._action_label(binding)
+            input_label = self._input_label(binding)
+
+            text = f"{input_label}: {action_label}"
+            # Truncate if too long
+            if fm.horizontalAdvance(text) > legend_width - 20:
+                text = text[:40] + "..."
+            lines.append(text)
+
+        lines_height = len(lines) * fm.lineSpacing()
+        more_count = len(bindings) - 15
+        content_height = 35 + lines_height + (fm.lineSpacing() if more_count > 0 else 0)
+
+        # Add a semi-transparent background for legend
+        bg_rect = QGraphicsRectItem(legend_x, legend_y, legend_width, min(content_height + 10, 400))
         bg_rect.setBrush(QBrush(QColor(255, 255, 255, 200)))
         bg_rect.setPen(QPen(QColor(0, 0, 0)))
         self.scene.addItem(bg_rect)
 
         # Add title
-        title = QGraphicsTextItem("Control Bindings")
-        title.setDefaultTextColor(QColor(0, 0, 0))
+        title = _make_text_item("Control Bindings", QColor(0, 0, 0))
         font = QFont("Arial", 12, QFont.Weight.Bold)
         title.setFont(font)
         title.setPos(legend_x + 10, legend_y + 5)
         self.scene.addItem(title)
 
-        # Add bindings (limit to first 15 to avoid overflow)
-        y_offset = 35
-        for i, (action_map_name, binding) in enumerate(bindings[:15]):
-            if i >= 15:
-                break
-
-            action_label = LabelGenerator.get_action_label(binding.action_name, binding)
-            input_label = LabelGenerator.generate_input_label(binding.input_code)
+        # All binding lines share one simple text item
+        if lines:
+            lines_item = _make_text_item('\n'.join(lines), QColor(0, 0, 0))
+            lines_item.setFont(line_font)
+            lines_item.setPos(legend_x + 10, legend_y + 35)
+            self.scene.addItem(lines_item)
 
-            text = f"{input_label}: {action_label}"
-            text_item = QGraphicsTextItem(text)
-            text_item.setDefaultTextColor(QColor(0, 0, 0))
-            font = QFont("Arial", 9)
-            text_item.setFont(font)
-            text_item.setPos(legend_x + 10, legend_y + y_offset)
-
-            # Truncate if too long
-            if text_item.boundingRect().width() > legend_width - 20:
-                text = text[:40] + "..."
-                text_item.setPlainText(text)
-
-            self.scene.addItem(text_item)
-            y_offset += 20
-
-        if len(bindings) > 15:
-            more_text = QGraphicsTextItem(f"... and {len(bindings) - 15} more")
-            more_text.setDefaultTextColor(QColor(100, 100, 100))
+        if more_count > 0:
+            more_text = _make_text_item(f"... and {more_count} more", QColor(100, 100, 100))
             font = QFont("Arial", 9, QFont.Weight.Bold)
             more_text.setFont(font)
-            more_text.setPos(legend_x + 10, legend_y + y_offset)
+            more_text.setPos(legend_x + 10, legend_y + 35 + lines_height)
             self.scene.addItem(more_text)
 
     def export_graphic(self):
@@ -735,9 +1215,6 @@ class DeviceGraphicsWidget(QWidget):
             # Check which button was clicked
             if msg_box.clickedButton() == open_button:
                 # Open the file with the default system application
-                import subprocess
-                import platform
-
                 try:
                     if platform.system() == 'Windows':
                         os.startfile(file_path)
@@ -761,7 +1238,7 @@ class DeviceGraphicsWidget(QWidget):
         rect = self.scene.sceneRect()
 
         # Create image
-        image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_ARGB32)
+        image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_RGB32)
         image.fill(Qt.GlobalColor.white)
 
         # Render scene to image
@@ -770,8 +1247,11 @@ class DeviceGraphicsWidget(QWidget):
         self.scene.render(painter)
         painter.end()
 
-        # Save image
-        image.save(file_path, "PNG")
+        # Save image with fast deflate; PNG is lossless at every level
+        writer = QImageWriter(file_path, b"PNG")
+        writer.setCompression(_PNG_FAST_COMPRESSION)
+        if not writer.write(image):
+            raise IOError(writer.errorString())
 
     def export_to_pdf(self, file_path: str):
         """Export scene to PDF using vector rendering for sharp text"""
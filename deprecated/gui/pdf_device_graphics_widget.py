@@ -387,7 +387,7 @@ class PDFDeviceGraphicsWidget(QWidget):
         rect = self.scene.sceneRect()
 
         # Create image
-        image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_ARGB32)
+        image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_RGB32)
         image.fill(Qt.GlobalColor.white)
 
         # Render scene to image
@@ -24,6 +24,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fully-qualified tag name of SVG <text> elements
+SVG_TEXT_TAG = '{http://www.w3.org/2000/svg}text'
+
+# Matches a button template tag like "{{ Button 12 }}" and captures the number
+BUTTON_TAG_RE = re.compile(r'\{\{\s*Button\s+(\d+)\s*\}\}')
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -157,18 +163,20 @@ class ButtonCoordinateDetector:
             return None
 
         # Find all text elements with button template tags
-        ns = {'svg': 'http://www.w3.org/2000/svg'}
         updated_count = 0
         added_count = 0
+        existing_buttons = set()
 
-        # First, try to update existing button text elements
-        for text_elem in root.findall('.//text', ns):
+        # First, try to update existing button text elements (iter walks the tree
+        # for the fully-qualified tag directly, with no XPath/namespace resolution)
+        for text_elem in root.iter(SVG_TEXT_TAG):
             text_content = ''.join(text_elem.itertext())
 
             # Look for button template tags like "{{ Button X }}"
-            match = re.search(r'\{\{\s*Button\s+(\d+)\s*\}\}', text_content)
+            match = BUTTON_TAG_RE.search(text_content)
             if match:
                 button_num = int(match.group(1))
+                existing_buttons.add(button_num)
 
                 # Find corresponding detection
                 detection = next((d for d in button_detections if d['button_number'] == button_num), None)
@@ -189,14 +197,6 @@ class ButtonCoordinateDetector:
                 else:
                     logger.warning(f"No OCR detection found for Button {button_num}")
 
-        # Find which buttons were detected but not in the SVG yet
-        existing_buttons = set()
-        for text_elem in root.findall('.//text', ns):
-            text_content = ''.join(text_elem.itertext())
-            match = re.search(r'\{\{\s*Button\s+(\d+)\s*\}\}', text_content)
-            if match:
-                existing_buttons.add(int(match.group(1)))
-
         # Add new button elements for detected buttons not in SVG
         for detection in button_detections:
             button_num = detection['button_number']
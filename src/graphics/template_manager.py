@@ -2,14 +2,47 @@
 Device template manager for loading and matching device graphics
 """
 
+import hashlib
 import json
 import logging
 import os
-from typing import List, Optional, Dict
+import pickle
+import re
+import sys
+from typing import List, Optional, Dict, FrozenSet, Tuple, Pattern, Sequence
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# orjson is an optional, faster drop-in for parsing the registry
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# lxml can filter iterparse events by tag; the stdlib parser is the fallback
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+# pyahocorasick is optional; without it device matching uses a combined regex
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+_SVG_TEXT_TAG = '{http://www.w3.org/2000/svg}text'
+
+# Bump when DeviceTemplate or the cache layout changes so stale caches are ignored
+_REGISTRY_CACHE_VERSION = 2
+_REGISTRY_CACHE_FILE = "template_registry.pkl"
+_TAG_RE = re.compile(r'\{\{\s*([^}]+?)\s*\}\}')
+
 
 @dataclass
 class DeviceTemplate:
@@ -22,6 +55,13 @@ class DeviceTemplate:
     button_coordinates: Dict[str, Dict[str, int]]
     overlay_path: Optional[str] = None
     button_range: Optional[List[int]] = None  # [min_button, max_button] for device splitting
+    overlay_tags: Optional[FrozenSet[str]] = None  # {{ tag }} contents, scanned on demand by refresh_overlay_tags
+    overlay_mtime_ns: Optional[int] = None  # Overlay mtime when overlay_tags was scanned
+    lower_patterns: Tuple[str, ...] = ()  # device_match_patterns lowercased once at construction
+
+    def __post_init__(self):
+        if not self.lower_patterns:
+            self.lower_patterns = tuple(p.lower() for p in self.device_match_patterns)
 
 
 class TemplateManager:
@@ -35,11 +75,28 @@ class TemplateManager:
             templates_dir: Path to visual-templates directory
         """
         self.templates_dir = templates_dir
-        self.templates: List[DeviceTemplate] = []
-        self.load_templates()
+        self._templates: List[DeviceTemplate] = []
+        self._loaded = False
+        self._needles: List[Tuple[str, DeviceTemplate]] = []
+        self._combined: Optional[Pattern] = None
+        self._automaton = None
+        self._by_id: Dict[str, DeviceTemplate] = {}
+        self._all_templates: Tuple[DeviceTemplate, ...] = ()
+
+    @property
+    def templates(self) -> List[DeviceTemplate]:
+        """Loaded templates (the registry is read on first access)"""
+        self._ensure_loaded()
+        return self._templates
+
+    def _ensure_loaded(self):
+        """Load the template registry the first time templates are needed"""
+        if not self._loaded:
+            self.load_templates()
 
     def load_templates(self):
         """Load template registry from JSON"""
+        self._loaded = True
         registry_path = os.path.join(self.templates_dir, "template_registry.json")
 
         if not os.path.exists(registry_path):
@@ -47,36 +104,108 @@ class TemplateManager:
             return
 
         try:
-            with open(registry_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            for template_data in data.get('templates', []):
-                # Skip PDF-only templates (v2.0 schema)
-                if 'image' not in template_data:
-                    logger.debug(f"Skipping PDF-only template: {template_data.get('id')}")
-                    continue
-
-                overlay_path = None
-                if 'overlay' in template_data:
-                    overlay_path = os.path.join(self.templates_dir, template_data['overlay'])
-
-                template = DeviceTemplate(
-                    id=template_data['id'],
-                    name=template_data['name'],
-                    image_path=os.path.join(self.templates_dir, template_data['image']),
-                    device_match_patterns=template_data['device_match_patterns'],
-                    device_type=template_data['type'],
-                    button_coordinates=template_data.get('buttons', {}),
-                    overlay_path=overlay_path,
-                    button_range=template_data.get('button_range')
-                )
-                self.templates.append(template)
-
-            logger.info(f"Loaded {len(self.templates)} device templates")
+            with open(registry_path, 'rb') as f:
+                registry_bytes = f.read()
+
+            # Reuse the pickled templates while the registry contents are unchanged
+            digest = hashlib.sha1(registry_bytes).hexdigest()
+            cache_path = os.path.join(_user_cache_dir(), _REGISTRY_CACHE_FILE)
+            templates = self._load_cached_templates(cache_path, digest)
+            if templates is None:
+                templates = self._parse_registry(registry_bytes)
+                self._write_cached_templates(cache_path, digest, templates)
+
+            # Templates are built and cached with registry-relative paths, so the
+            # cache stays valid wherever the templates directory is unpacked
+            base = os.path.join(os.fspath(self.templates_dir), '')
+            for template in templates:
+                template.image_path = base + template.image_path
+                if template.overlay_path:
+                    template.overlay_path = base + template.overlay_path
+
+            self._templates.extend(templates)
+
+            self._build_matcher()
+            self._by_id = {}
+            for template in self._templates:
+                # First registration wins, as with the previous linear scan
+                self._by_id.setdefault(template.id, template)
+            self._all_templates = tuple(self._templates)
+
+            logger.info(f"Loaded {len(self._templates)} device templates")
 
         except Exception as e:
             logger.error(f"Error loading template registry: {e}", exc_info=True)
 
+    def _parse_registry(self, registry_bytes: bytes) -> List[DeviceTemplate]:
+        """
+        Build templates from the registry JSON
+
+        Args:
+            registry_bytes: Raw contents of template_registry.json
+
+        Returns:
+            List of image templates with registry-relative paths (PDF-only entries are skipped)
+        """
+        # Both orjson and json decode UTF-8 bytes themselves
+        data = _loads(registry_bytes)
+
+        templates = []
+        for template_data in data.get('templates', []):
+            # Skip PDF-only templates (v2.0 schema)
+            if 'image' not in template_data:
+                logger.debug(f"Skipping PDF-only template: {template_data.get('id')}")
+                continue
+
+            templates.append(DeviceTemplate(
+                id=template_data['id'],
+                name=template_data['name'],
+                image_path=template_data['image'],
+                device_match_patterns=template_data['device_match_patterns'],
+                device_type=template_data['type'],
+                button_coordinates=template_data.get('buttons', {}),
+                overlay_path=template_data.get('overlay'),
+                button_range=template_data.get('button_range')
+            ))
+
+        return templates
+
+    @staticmethod
+    def _cache_header(digest: str) -> bytes:
+        """Plain-text first line of the cache, checked before anything is unpickled"""
+        return json.dumps({'version': _REGISTRY_CACHE_VERSION, 'registry_sha1': digest}).encode('utf-8') + b'\n'
+
+    def _load_cached_templates(self, cache_path: str, digest: str) -> Optional[List[DeviceTemplate]]:
+        """Load pickled templates if they were built from the current registry contents"""
+        try:
+            with open(cache_path, 'rb') as f:
+                # Only unpickle a payload whose header matches this registry
+                if f.readline() != self._cache_header(digest):
+                    return None
+                templates = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable template cache {cache_path}: {e}")
+            return None
+
+        logger.debug(f"Using cached templates from {cache_path}")
+        return templates
+
+    def _write_cached_templates(self, cache_path: str, digest: str,
+                                templates: List[DeviceTemplate]):
+        """Pickle templates into the user cache directory, replacing any old cache atomically"""
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(self._cache_header(digest))
+                pickle.dump(templates, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # Without a writable cache directory the registry is simply parsed each run
+            logger.debug(f"Could not write template cache {cache_path}: {e}")
+
     def find_template(self, device_name: str) -> Optional[DeviceTemplate]:
         """
         Find a template that matches the device name
@@ -90,23 +219,162 @@ class TemplateManager:
         if not device_name:
             return None
 
+        self._ensure_loaded()
         device_name_lower = device_name.lower()
 
-        # Try exact pattern matching first
-        for template in self.templates:
-            for pattern in template.device_match_patterns:
-                if pattern.lower() in device_name_lower:
-                    return template
+        # The lowest needle index among all matches is the template the original
+        # in-order scan over templates and patterns would have returned
+        best = None
+        if self._automaton is not None:
+            for _, index in self._automaton.iter(device_name_lower):
+                if best is None or index < best:
+                    best = index
+        elif self._combined is not None:
+            # Every start position reports its lowest-index needle
+            for match in self._combined.finditer(device_name_lower):
+                index = int(match.lastgroup[1:])
+                if best is None or index < best:
+                    best = index
 
-        return None
+        return self._needles[best][1] if best is not None else None
+
+    def _build_matcher(self):
+        """Compile all device match patterns into a single case-folded matcher"""
+        self._needles = [
+            (pattern, template)
+            for template in self._templates
+            for pattern in template.lower_patterns
+        ]
+
+        self._automaton = None
+        if not self._needles:
+            self._combined = None
+            return
+
+        # Aho-Corasick finds every pattern in one linear pass over the name
+        # (empty patterns match everything and can't be added as automaton words)
+        if _HAS_AHOCORASICK and all(pattern for pattern, _ in self._needles):
+            automaton = ahocorasick.Automaton()
+            for i, (pattern, _) in enumerate(self._needles):
+                if pattern not in automaton:
+                    # Keep the first (lowest) index for duplicate patterns
+                    automaton.add_word(pattern, i)
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._combined = None
+            return
+
+        # Zero-width lookahead so overlapping matches at later positions are still seen
+        alternatives = '|'.join(
+            f'(?P<t{i}>{re.escape(pattern)})' for i, (pattern, _) in enumerate(self._needles)
+        )
+        self._combined = re.compile(f'(?=(?:{alternatives}))')
 
     def get_template_by_id(self, template_id: str) -> Optional[DeviceTemplate]:
         """Get template by ID"""
-        for template in self.templates:
-            if template.id == template_id:
-                return template
+        self._ensure_loaded()
+        return self._by_id.get(template_id)
+
+    def get_all_templates(self) -> Sequence[DeviceTemplate]:
+        """Get all available templates (read-only, rebuilt on load)"""
+        self._ensure_loaded()
+        return self._all_templates
+
+    def refresh_overlay_tags(self, template: DeviceTemplate) -> Optional[FrozenSet[str]]:
+        """
+        Return the overlay's {{ tag }} set, rescanning only if the SVG changed on disk
+
+        Args:
+            template: Template whose overlay should be scanned
+
+        Returns:
+            Frozen set of tag contents, or None if the template has no readable overlay
+        """
+        if not template.overlay_path:
+            return None
+
+        try:
+            mtime_ns = os.stat(template.overlay_path).st_mtime_ns
+        except OSError:
+            template.overlay_tags = None
+            template.overlay_mtime_ns = None
+            return None
+
+        if template.overlay_tags is not None and template.overlay_mtime_ns == mtime_ns:
+            return template.overlay_tags
+
+        try:
+            template.overlay_tags = scan_overlay_tags(template.overlay_path)
+            template.overlay_mtime_ns = mtime_ns
+        except Exception as e:
+            logger.warning(f"Could not scan overlay tags for {template.id}: {e}")
+            template.overlay_tags = None
+            template.overlay_mtime_ns = None
+
+        return template.overlay_tags
+
+
+def _user_cache_dir() -> str:
+    """
+    Per-user directory for rebuildable caches
+
+    Kept out of the install directory, which may be read-only or (in one-file
+    builds) unpacked to a fresh temporary directory on every launch.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.environ.get('APPDATA') or os.path.expanduser('~')
+        return os.path.join(base, 'SCProfileViewer', 'cache')
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'SCProfileViewer')
+
+
+def scan_overlay_tags(svg_path: str) -> FrozenSet[str]:
+    """
+    Collect the {{ tag }} contents of all <text> elements in an SVG overlay
+
+    Streams the file with iterparse and clears each element once seen, so
+    the full DOM is never materialized.
+
+    Args:
+        svg_path: Path to SVG overlay
+
+    Returns:
+        Frozen set of tag contents (e.g., {"Button 1", "Hat 1 Up"})
+    """
+    tags = set()
+
+    if _HAS_LXML:
+        events = ET.iterparse(svg_path, events=('end',), tag=_SVG_TEXT_TAG)
+    else:
+        events = ET.iterparse(svg_path, events=('end',))
+
+    for _, elem in events:
+        if elem.tag == _SVG_TEXT_TAG:
+            tag = _extract_tag(elem.text or '')
+            if tag:
+                tags.add(sys.intern(tag))
+        elem.clear()
+
+    return frozenset(tags)
+
+
+def _extract_tag(text: str) -> Optional[str]:
+    """
+    Extract the content of the first {{ tag }} in text
+
+    Uses plain str.find scans for the common case and only falls back to
+    _TAG_RE when the tag content contains stray braces.
+    """
+    start = text.find('{{')
+    if start == -1:
         return None
+    end = text.find('}}', start + 2)
+    if end == -1:
+        return None
+
+    content = text[start + 2:end]
+    if '{' in content or '}' in content:
+        match = _TAG_RE.search(text)
+        return match.group(1).strip() if match else None
 
-    def get_all_templates(self) -> List[DeviceTemplate]:
-        """Get all available templates"""
-        return self.templates.copy()
+    return content.strip() or None
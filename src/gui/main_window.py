@@ -4,17 +4,23 @@ Main application window
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QPushButton, QLabel, QFileDialog, QMessageBox,
-                              QTextEdit, QTableWidget, QTableWidgetItem, QSplitter,
+                              QTextEdit, QTableView, QAbstractItemView, QSplitter,
                               QLineEdit, QComboBox, QGroupBox, QCheckBox, QTabWidget,
-                              QStyledItemDelegate, QDialog, QTextBrowser)
-from PyQt6.QtCore import Qt, QSortFilterProxyModel, QTimer, QUrl, QEvent
-from PyQt6.QtGui import QStandardItemModel, QStandardItem, QDesktopServices, QPixmap, QCursor
+                              QStyledItemDelegate, QDialog, QTextBrowser, QMenu, QInputDialog)
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QSortFilterProxyModel, QModelIndex, QSignalBlocker,
+                          QTimer, QUrl, QEvent, pyqtSignal, QObject, QRunnable, QThreadPool)
+from PyQt6.QtGui import QDesktopServices, QPixmap, QCursor
 import sys
 import os
+import re
+import csv
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Joystick input code prefix, capturing the instance (e.g. "js2_button5" -> "2")
+_JS_INSTANCE_RE = re.compile(r'js(\d+)_')
+
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -36,6 +42,7 @@ from models.profile_model import ControlProfile
 from utils.settings import AppSettings
 from utils.version import get_version
 from utils.device_splitter import get_device_for_input
+from utils.label_overrides import get_override_manager
 
 # Import PDF widget - QtPdf is the only PDF viewer (WebEngine removed to reduce installer size)
 PDF_WIDGET_AVAILABLE = False
@@ -80,6 +87,194 @@ class SelectAllDelegate(QStyledItemDelegate):
             super().setEditorData(editor, index)
 
 
+class BindingsTableModel(QAbstractTableModel):
+    """
+    Controls table model serving cell text straight from the cached row strings
+
+    Each row is a tuple of (Action Map, Action (original), Action (Override),
+    Input Code, Input Label, Device). Only the override column is editable;
+    edits are reported through label_edited rather than stored directly, so the
+    override can be saved and the affected rows refreshed with update_row().
+    """
+
+    HEADERS = ["Action Map", "Action", "Action (Override)", "Input Code", "Input Label", "Device"]
+    OVERRIDE_COLUMN = 2
+
+    # Emitted when the override cell is edited: (row, new_text)
+    label_edited = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows: list):
+        """Replace all rows; the list is shared, not copied"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def update_row(self, row: int):
+        """Notify views that a row's strings were replaced in the shared list"""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.OVERRIDE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != self.OVERRIDE_COLUMN:
+            return False
+        value = value or ""
+        # Committing an editor without changing its text is not an edit
+        if value != self._rows[index.row()][index.column()]:
+            self.label_edited.emit(index.row(), value)
+        return True
+
+
+class BindingsFilterProxyModel(QSortFilterProxyModel):
+    """Sorts the controls table and filters it from per-binding cached strings"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_cache = []
+        self._row_search_blob = []
+        self._row_unmapped = []
+        self._search_text = ""
+        self._device_filter = "All Devices"
+        self._actionmap_filter = "All Action Maps"
+        self._hide_unmapped = False
+
+    def set_rows(self, row_cache: list, row_search_blob: list):
+        """Set the cached row strings, indexed by source model row"""
+        self._row_cache = row_cache
+        self._row_search_blob = row_search_blob
+        # Whether a row is unmapped depends only on its input, so decide it once per populate
+        self._row_unmapped = [self._is_unmapped(row[3], row[4]) for row in row_cache]
+
+    @staticmethod
+    def _is_unmapped(input_code: str, input_label: str) -> bool:
+        """Whether an input code/label pair shows an empty (unmapped) binding"""
+        input_code = input_code.strip()
+        input_label = input_label.strip()
+
+        # Check if they're the same after stripping
+        if input_code == input_label:
+            return True
+        # Also check for patterns that indicate unmapped keys
+        # e.g., "Keyboard: ", "Joystick 1: ", "Mouse: " with nothing after
+        return input_label.endswith(': ') or input_label.endswith(':')
+
+    def set_filters(self, search_text: str, device_filter: str, actionmap_filter: str, hide_unmapped: bool):
+        """Update all filter settings and re-filter the table"""
+        if (search_text, device_filter, actionmap_filter, hide_unmapped) == (
+                self._search_text, self._device_filter, self._actionmap_filter, self._hide_unmapped):
+            return
+        self._search_text = search_text
+        self._device_filter = device_filter
+        self._actionmap_filter = actionmap_filter
+        self._hide_unmapped = hide_unmapped
+        self.invalidateFilter()
+
+    def set_search_text(self, search_text: str):
+        """Filter rows containing the (lowercased) search text"""
+        if search_text == self._search_text:
+            return
+        self._search_text = search_text
+        self.invalidateFilter()
+
+    def set_device_filter(self, device_filter: str):
+        """Filter rows by device name"""
+        if device_filter == self._device_filter:
+            return
+        self._device_filter = device_filter
+        self.invalidateFilter()
+
+    def set_actionmap_filter(self, actionmap_filter: str):
+        """Filter rows by action map label"""
+        if actionmap_filter == self._actionmap_filter:
+            return
+        self._actionmap_filter = actionmap_filter
+        self.invalidateFilter()
+
+    def set_hide_unmapped(self, hide_unmapped: bool):
+        """Hide rows whose input has no mapping"""
+        if hide_unmapped == self._hide_unmapped:
+            return
+        self._hide_unmapped = hide_unmapped
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Whether a binding passes the current filters"""
+        if source_row >= len(self._row_cache):
+            return True
+        row = self._row_cache[source_row]
+
+        # Search filter - check all columns
+        if self._search_text and self._search_text not in self._row_search_blob[source_row]:
+            return False
+
+        # Device filter
+        if self._device_filter != "All Devices" and row[5] != self._device_filter:
+            return False
+
+        # Action map filter
+        if self._actionmap_filter != "All Action Maps" and row[0] != self._actionmap_filter:
+            return False
+
+        # Unmapped keys filter (input_code == input_label, or an empty "Device: " label)
+        if self._hide_unmapped and self._row_unmapped[source_row]:
+            return False
+
+        return True
+
+
+class _ProfileParseSignals(QObject):
+    """Signals for ProfileParseJob (QRunnable is not a QObject)"""
+
+    # job id, profile path, parsed ControlProfile or None, exception or None
+    finished = pyqtSignal(int, str, object, object)
+
+
+class ProfileParseJob(QRunnable):
+    """
+    Parse a profile XML file on a pool thread
+
+    The parser builds plain model objects only, so the result is handed to the
+    UI thread through the finished signal for display.
+    """
+
+    def __init__(self, job_id: int, file_path: str):
+        super().__init__()
+        self.job_id = job_id
+        self.file_path = file_path
+        self.signals = _ProfileParseSignals()
+
+    def run(self):
+        try:
+            profile, error = ProfileParser(self.file_path).parse(), None
+        except Exception as e:
+            profile, error = None, e
+        self.signals.finished.emit(self.job_id, self.file_path, profile, error)
+
+
 class MainWindow(QMainWindow):
     """Main application window for SC Profile Editor"""
 
@@ -99,6 +294,22 @@ class MainWindow(QMainWindow):
         # Store all bindings for filtering
         self.all_bindings = []
 
+        # Per-binding display strings, indexed like all_bindings (not by the sorted table row)
+        self._row_cache = []
+        self._row_search_blob = []
+
+        # Device column values keyed by input code, rebuilt per loaded profile
+        self._js_instance_to_name = {}
+        self._device_cache = {}
+        # Generated (non-override) table labels, rebuilt per loaded profile
+        self._label_cache = {}
+
+        # Incremented per load request so a slower, superseded parse is not displayed
+        self._profile_job_id = 0
+
+        # Label override manager, obtained on first use
+        self._override_manager = None
+
         # Create UI
         self.setup_ui()
 
@@ -185,26 +396,31 @@ class MainWindow(QMainWindow):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Type to filter actions, inputs, or devices...")
-        self.search_box.textChanged.connect(self.apply_filters)
+        # Debounce typing so the table is re-filtered once the user pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.on_search_text_changed)
+        self.search_box.textChanged.connect(self._search_timer.start)
         filter_layout.addWidget(self.search_box, 2)
 
         # Device filter
         filter_layout.addWidget(QLabel("Device:"))
         self.device_filter = QComboBox()
         self.device_filter.addItem("All Devices")
-        self.device_filter.currentTextChanged.connect(self.apply_filters)
+        self.device_filter.currentTextChanged.connect(self.on_device_filter_changed)
         filter_layout.addWidget(self.device_filter, 1)
 
         # Action Map filter
         filter_layout.addWidget(QLabel("Action Map:"))
         self.actionmap_filter = QComboBox()
         self.actionmap_filter.addItem("All Action Maps")
-        self.actionmap_filter.currentTextChanged.connect(self.apply_filters)
+        self.actionmap_filter.currentTextChanged.connect(self.on_actionmap_filter_changed)
         filter_layout.addWidget(self.actionmap_filter, 1)
 
         # Hide unmapped keys checkbox
         self.hide_unmapped_checkbox = QCheckBox("Hide Unmapped Keys")
-        self.hide_unmapped_checkbox.stateChanged.connect(self.apply_filters)
+        self.hide_unmapped_checkbox.toggled.connect(self.on_hide_unmapped_toggled)
         filter_layout.addWidget(self.hide_unmapped_checkbox)
 
         # Show detailed checkbox
@@ -238,18 +454,20 @@ class MainWindow(QMainWindow):
         self.profile_summary.setPlaceholderText("Profile summary will appear here...")
         splitter.addWidget(self.profile_summary)
 
-        # Controls table
-        self.controls_table = QTableWidget()
-        self.controls_table.setColumnCount(6)  # Max columns for detailed view
-        self.controls_table.setHorizontalHeaderLabels([
-            "Action Map", "Action", "Action (Override)", "Input Code", "Input Label", "Device"
-        ])
+        # Controls table: bindings model -> sort/filter proxy -> view
+        self.bindings_model = BindingsTableModel(self)
+        self.bindings_model.label_edited.connect(self.on_cell_edited)
+        self.proxy_model = BindingsFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.bindings_model)
+
+        self.controls_table = QTableView()
+        self.controls_table.setModel(self.proxy_model)
         self.controls_table.horizontalHeader().setStretchLastSection(False)
         self.controls_table.setAlternatingRowColors(True)
+        # Start in profile order until a header is clicked
+        self.controls_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.controls_table.setSortingEnabled(True)
-        self.controls_table.setEditTriggers(QTableWidget.EditTrigger.DoubleClicked)
-        self.controls_table.itemChanged.connect(self.on_cell_edited)
-        self.controls_table.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.controls_table.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked)
 
         # Enable context menu for remapping
         self.controls_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -261,10 +479,6 @@ class MainWindow(QMainWindow):
 
         splitter.addWidget(self.controls_table)
 
-        # Track editing state
-        self._editing_item = None
-        self._editing_default_text = None  # Stores the default label (without custom override)
-
         # Track editable columns (column 2 is Action Override, editable only in detailed view)
         self.editable_columns = {2}  # Column 2: Action (Override)
 
@@ -540,12 +754,25 @@ class MainWindow(QMainWindow):
         Args:
             file_path: Path to the profile XML file
         """
+        # Parse the profile on the thread pool so the window stays responsive;
+        # only the most recently requested file is displayed
+        self.statusBar().showMessage(f"Loading profile: {file_path}")
+        logger.info(f"Loading profile: {file_path}")
+        self._profile_job_id += 1
+        job = ProfileParseJob(self._profile_job_id, file_path)
+        job.signals.finished.connect(self._on_profile_parsed)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_profile_parsed(self, job_id: int, file_path: str, profile, error):
+        """Display a profile parsed by ProfileParseJob, or report why it failed"""
+        if job_id != self._profile_job_id:
+            return
+
         try:
-            # Parse the profile
-            self.statusBar().showMessage(f"Loading profile: {file_path}")
-            logger.info(f"Loading profile: {file_path}")
-            parser = ProfileParser(file_path)
-            self.current_profile = parser.parse()
+            if error is not None:
+                raise error
+
+            self.current_profile = profile
             self.current_profile_path = file_path
 
             # Save as last opened profile
@@ -586,14 +813,17 @@ class MainWindow(QMainWindow):
         self.profile_info_label.setText(f"Profile: {profile.profile_name}")
 
         # Build summary text
-        summary_parts = []
-        summary_parts.append(f"Profile Name: {profile.profile_name}")
-        summary_parts.append(f"Devices: {len(profile.devices)}")
+        summary_parts = [
+            f"Profile Name: {profile.profile_name}",
+            f"Devices: {len(profile.devices)}",
+        ]
 
         # List devices
-        for device in profile.devices:
-            device_name = device.product_name if device.product_name else device.device_type.capitalize()
-            summary_parts.append(f"  - {device.device_type.capitalize()} {device.instance}: {device_name}")
+        summary_parts.extend(
+            f"  - {device.device_type.capitalize()} {device.instance}: "
+            f"{device.product_name or device.device_type.capitalize()}"
+            for device in profile.devices
+        )
 
         summary_parts.append(f"\nAction Maps: {len(profile.action_maps)}")
         summary_parts.append(f"Total Bindings: {len(profile.get_all_bindings())}")
@@ -603,7 +833,17 @@ class MainWindow(QMainWindow):
             if len(profile.categories) > 5:
                 summary_parts.append(f"  ... and {len(profile.categories) - 5} more")
 
-        self.profile_summary.setText('\n'.join(summary_parts))
+        # Plain text: skips rich-text detection and keeps '<' in device names literal
+        self.profile_summary.setPlainText('\n'.join(summary_parts))
+
+        # Resolve joystick instances to device names once for parse_device_from_input
+        self._js_instance_to_name = {}
+        for device in profile.devices:
+            if device.device_type == 'joystick':
+                self._js_instance_to_name.setdefault(
+                    device.instance, device.product_name or f"Joystick {device.instance}")
+        self._device_cache = {}
+        self._label_cache = {}
 
         # Populate controls table
         self.populate_controls_table()
@@ -620,25 +860,53 @@ class MainWindow(QMainWindow):
         if not self.current_profile:
             return
 
-        # Disable sorting while populating
-        self.controls_table.setSortingEnabled(False)
-
-        # Block signals to prevent itemChanged from triggering during population
-        self.controls_table.blockSignals(True)
-
         # Get all bindings and store for filtering
         self.all_bindings = []
         for action_map in self.current_profile.action_maps:
             for binding in action_map.actions:
                 self.all_bindings.append((action_map.name, binding))
 
-        # Populate filter dropdowns
+        # Build each row's strings; the model serves cell text straight from these,
+        # and filtering never reads them back from Qt
+        self._row_cache = []
+        self._row_search_blob = []
+        # Override-aware action labels, resolved once per action name; a binding's own
+        # custom label still takes priority, as in LabelGenerator.get_action_label
+        action_labels = {}
+        for action_map_name, binding in self.all_bindings:
+            action_map_label, action_label_original, input_label, device = \
+                self._generated_labels(action_map_name, binding)
+
+            action_label = binding.custom_label
+            if not action_label:
+                action_label = action_labels.get(binding.action_name)
+                if action_label is None:
+                    action_label = LabelGenerator.get_action_label(binding.action_name)
+                    action_labels[binding.action_name] = action_label
+
+            # Columns: Action Map, Action (original auto-generated), Action (with override,
+            # editable), Input Code (raw), Input Label (human-readable), Device
+            row_data = (action_map_label, action_label_original, action_label,
+                        binding.input_code, input_label, device)
+            self._row_cache.append(row_data)
+            self._row_search_blob.append((' '.join(row_data) + ' ').lower())
+
+        # Populate filter dropdowns from the rows just built
         self.populate_filter_dropdowns()
 
-        # Set row count
-        self.controls_table.setRowCount(len(self.all_bindings))
+        # Reset the model onto the new rows; the proxy re-applies the current sort and filters.
+        # Repaints are held off until the columns are configured for the new rows.
+        self.controls_table.setUpdatesEnabled(False)
+        self.proxy_model.set_rows(self._row_cache, self._row_search_blob)
+        self.bindings_model.set_rows(self._row_cache)
+
+        # A model reset clears the header's section state, so configure the columns again
+        self._apply_view_mode()
 
-        # Determine if we're in detailed view
+        self.controls_table.setUpdatesEnabled(True)
+
+    def _apply_view_mode(self):
+        """Show the columns and widths for the default or detailed view"""
         is_detailed = self.show_detailed_checkbox.isChecked()
 
         # Configure column visibility based on view mode
@@ -657,54 +925,8 @@ class MainWindow(QMainWindow):
             self.controls_table.setColumnHidden(4, False)  # Show Input Label
             self.controls_table.setColumnHidden(2, False)  # Show override column (as "Action")
 
-        # Populate table
-        for row, (action_map_name, binding) in enumerate(self.all_bindings):
-            # Column 0: Action Map
-            action_map_label = LabelGenerator.generate_actionmap_label(action_map_name)
-            action_map_item = QTableWidgetItem(action_map_label)
-            action_map_item.setFlags(action_map_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.controls_table.setItem(row, 0, action_map_item)
-
-            # Column 1: Action (original auto-generated) - only visible in detailed view
-            action_label_original = LabelGenerator.generate_action_label(binding.action_name)
-            action_original_item = QTableWidgetItem(action_label_original)
-            action_original_item.setFlags(action_original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.controls_table.setItem(row, 1, action_original_item)
-
-            # Column 2: Action (with override) - editable, visible in both views
-            action_label_override = LabelGenerator.get_action_label(binding.action_name, binding)
-            action_override_item = QTableWidgetItem(action_label_override)
-            # Store binding reference in the item for later retrieval during editing
-            action_override_item.setData(Qt.ItemDataRole.UserRole, (action_map_name, binding))
-            self.controls_table.setItem(row, 2, action_override_item)
-
-            # Column 3: Input Code (raw) - only visible in detailed view
-            input_code_item = QTableWidgetItem(binding.input_code)
-            input_code_item.setFlags(input_code_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.controls_table.setItem(row, 3, input_code_item)
-
-            # Column 4: Input Label (human-readable) - only visible in detailed view
-            input_label = LabelGenerator.generate_input_label(binding.input_code)
-            input_label_item = QTableWidgetItem(input_label)
-            input_label_item.setFlags(input_label_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.controls_table.setItem(row, 4, input_label_item)
-
-            # Column 5: Device (parsed from input code)
-            device = self.parse_device_from_input(binding.input_code)
-            device_item = QTableWidgetItem(device)
-            device_item.setFlags(device_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.controls_table.setItem(row, 5, device_item)
-
-        # Re-enable signals
-        self.controls_table.blockSignals(False)
-
-        # Re-enable sorting
-        self.controls_table.setSortingEnabled(True)
-
-        # Resize columns to content
-        self.controls_table.resizeColumnsToContents()
-
-        # Set column widths based on view mode
+        # Set column widths based on view mode (every shown column gets a fixed width,
+        # so sizing them to their contents first would be wasted work)
         if is_detailed:
             self.controls_table.setColumnWidth(0, 200)  # Action Map
             self.controls_table.setColumnWidth(1, 200)  # Action (Original)
@@ -718,22 +940,57 @@ class MainWindow(QMainWindow):
             self.controls_table.setColumnWidth(4, 200)  # Input Label
             self.controls_table.setColumnWidth(5, 150)  # Device
 
+    def _binding_at(self, index):
+        """Get the (action_map_name, binding) for a view index, or None"""
+        if not index.isValid():
+            return None
+        row = self.proxy_model.mapToSource(index).row()
+        return self.all_bindings[row] if 0 <= row < len(self.all_bindings) else None
+
+    def _generated_labels(self, action_map_name: str, binding) -> tuple:
+        """
+        Get the generated labels for a binding's table row
+
+        These depend only on the action map, action and input code, so they are
+        computed once per loaded profile rather than on every repopulate.
+
+        Returns:
+            Tuple of (action map label, action label, input label, device)
+        """
+        key = (action_map_name, binding.action_name, binding.input_code)
+        labels = self._label_cache.get(key)
+        if labels is None:
+            labels = (
+                LabelGenerator.generate_actionmap_label(action_map_name),
+                LabelGenerator.generate_action_label(binding.action_name),
+                LabelGenerator.generate_input_label(binding.input_code),
+                self.parse_device_from_input(binding.input_code),
+            )
+            self._label_cache[key] = labels
+        return labels
+
     def parse_device_from_input(self, input_code: str) -> str:
-        """Parse device type from input code"""
+        """Parse device type from input code (memoized per loaded profile)"""
+        device = self._device_cache.get(input_code)
+        if device is None:
+            device = self._parse_device_from_input(input_code)
+            self._device_cache[input_code] = device
+        return device
+
+    def _parse_device_from_input(self, input_code: str) -> str:
+        """Uncached body of parse_device_from_input"""
         if input_code.startswith('kb'):
             return "Keyboard"
         elif input_code.startswith('js'):
             # Extract joystick instance
-            import re
-            match = re.match(r'js(\d+)_', input_code)
+            match = _JS_INSTANCE_RE.match(input_code)
             if match:
                 instance = match.group(1)
                 # Try to find device name
-                for device in self.current_profile.devices:
-                    if device.device_type == 'joystick' and device.instance == int(instance):
-                        device_name = device.product_name if device.product_name else f"Joystick {instance}"
-                        # Split composite devices (e.g., VKB Gladiator + SEM)
-                        return get_device_for_input(device_name, input_code)
+                device_name = self._js_instance_to_name.get(int(instance))
+                if device_name:
+                    # Split composite devices (e.g., VKB Gladiator + SEM)
+                    return get_device_for_input(device_name, input_code)
                 return f"Joystick {instance}"
         elif 'mouse' in input_code.lower():
             return "Mouse"
@@ -741,110 +998,78 @@ class MainWindow(QMainWindow):
 
     def populate_filter_dropdowns(self):
         """Populate the device and action map filter dropdowns"""
-        # Get unique devices
-        devices = set()
-        action_maps = set()
-
-        for action_map_name, binding in self.all_bindings:
-            device = self.parse_device_from_input(binding.input_code)
-            devices.add(device)
-            action_map_label = LabelGenerator.generate_actionmap_label(action_map_name)
-            action_maps.add(action_map_label)
+        # Get unique devices and action maps from the cached row strings
+        devices = {row[5] for row in self._row_cache}
+        action_maps = {row[0] for row in self._row_cache}
 
         # Save current selections before clearing
         current_device = self.device_filter.currentText()
         current_actionmap = self.actionmap_filter.currentText()
 
         # Update device filter
-        self.device_filter.blockSignals(True)
-        self.device_filter.clear()
-        self.device_filter.addItem("All Devices")
-        for device in sorted(devices):
-            self.device_filter.addItem(device)
+        with QSignalBlocker(self.device_filter):
+            self.device_filter.clear()
+            self.device_filter.addItems(["All Devices", *sorted(devices)])
 
-        # Restore previous selection if it still exists
-        if current_device:
-            index = self.device_filter.findText(current_device)
-            if index >= 0:
-                self.device_filter.setCurrentIndex(index)
-
-        self.device_filter.blockSignals(False)
+            # Restore previous selection if it still exists
+            if current_device:
+                index = self.device_filter.findText(current_device)
+                if index >= 0:
+                    self.device_filter.setCurrentIndex(index)
 
         # Update action map filter
-        self.actionmap_filter.blockSignals(True)
-        self.actionmap_filter.clear()
-        self.actionmap_filter.addItem("All Action Maps")
-        for action_map in sorted(action_maps):
-            self.actionmap_filter.addItem(action_map)
-
-        # Restore previous selection if it still exists
-        if current_actionmap:
-            index = self.actionmap_filter.findText(current_actionmap)
-            if index >= 0:
-                self.actionmap_filter.setCurrentIndex(index)
+        with QSignalBlocker(self.actionmap_filter):
+            self.actionmap_filter.clear()
+            self.actionmap_filter.addItems(["All Action Maps", *sorted(action_maps)])
 
-        self.actionmap_filter.blockSignals(False)
+            # Restore previous selection if it still exists
+            if current_actionmap:
+                index = self.actionmap_filter.findText(current_actionmap)
+                if index >= 0:
+                    self.actionmap_filter.setCurrentIndex(index)
 
     def apply_filters(self):
         """Apply current filter settings to the table"""
         if not self.all_bindings:
             return
 
+        self._search_timer.stop()
         search_text = self.search_box.text().lower()
         device_filter = self.device_filter.currentText()
         actionmap_filter = self.actionmap_filter.currentText()
         hide_unmapped = self.hide_unmapped_checkbox.isChecked()
 
-        # Show/hide rows based on filters
-        for row in range(self.controls_table.rowCount()):
-            show_row = True
-
-            # Search filter - check all columns
-            if search_text:
-                row_text = ""
-                for col in range(self.controls_table.columnCount()):
-                    item = self.controls_table.item(row, col)
-                    if item:
-                        row_text += item.text().lower() + " "
-
-                if search_text not in row_text:
-                    show_row = False
-
-            # Device filter
-            if show_row and device_filter != "All Devices":
-                device_item = self.controls_table.item(row, 5)  # Device is now column 5
-                if device_item and device_item.text() != device_filter:
-                    show_row = False
-
-            # Action map filter
-            if show_row and actionmap_filter != "All Action Maps":
-                actionmap_item = self.controls_table.item(row, 0)
-                if actionmap_item and actionmap_item.text() != actionmap_filter:
-                    show_row = False
-
-            # Unmapped keys filter - check if input_code == input_label (after stripping)
-            # or if the label indicates an empty/unmapped binding
-            if show_row and hide_unmapped:
-                input_code_item = self.controls_table.item(row, 3)  # Input Code is now column 3
-                input_label_item = self.controls_table.item(row, 4)  # Input Label is now column 4
-                if input_code_item and input_label_item:
-                    input_code = input_code_item.text().strip()
-                    input_label = input_label_item.text().strip()
-
-                    # Check if they're the same after stripping
-                    if input_code == input_label:
-                        show_row = False
-                    # Also check for patterns that indicate unmapped keys
-                    # e.g., "Keyboard: ", "Joystick 1: ", "Mouse: " with nothing after
-                    elif input_label.endswith(': ') or input_label.endswith(':'):
-                        show_row = False
-
-            self.controls_table.setRowHidden(row, not show_row)
-
-        # Update status bar
-        visible_rows = sum(1 for row in range(self.controls_table.rowCount())
-                          if not self.controls_table.isRowHidden(row))
-        total_rows = self.controls_table.rowCount()
+        self.proxy_model.set_filters(search_text, device_filter, actionmap_filter, hide_unmapped)
+        self.update_filter_status()
+
+    def on_search_text_changed(self):
+        """Re-filter the table for the current search text"""
+        self._search_timer.stop()
+        self.proxy_model.set_search_text(self.search_box.text().lower())
+        self.update_filter_status()
+
+    def on_device_filter_changed(self, device_filter: str):
+        """Re-filter the table for the selected device"""
+        self.proxy_model.set_device_filter(device_filter)
+        self.update_filter_status()
+
+    def on_actionmap_filter_changed(self, actionmap_filter: str):
+        """Re-filter the table for the selected action map"""
+        self.proxy_model.set_actionmap_filter(actionmap_filter)
+        self.update_filter_status()
+
+    def on_hide_unmapped_toggled(self, checked: bool):
+        """Re-filter the table when unmapped keys are hidden or shown"""
+        self.proxy_model.set_hide_unmapped(checked)
+        self.update_filter_status()
+
+    def update_filter_status(self):
+        """Show the number of visible bindings in the status bar"""
+        if not self.all_bindings:
+            return
+
+        visible_rows = self.proxy_model.rowCount()
+        total_rows = self.bindings_model.rowCount()
         self.statusBar().showMessage(f"Showing {visible_rows} of {total_rows} bindings")
 
     def toggle_detailed_view(self):
@@ -853,20 +1078,18 @@ class MainWindow(QMainWindow):
             return
 
         # Check if user is currently editing a cell
-        current_item = self.controls_table.currentItem()
-        if current_item and current_item.column() == 2:  # Action (Override) column
+        current_index = self.controls_table.currentIndex()
+        if current_index.isValid() and current_index.column() == 2:  # Action (Override) column
             # Check if there's an active editor widget
-            editor = self.controls_table.cellWidget(current_item.row(), current_item.column())
+            editor = self.controls_table.indexWidget(current_index)
             if not editor:
-                # Check if the item is in edit mode via QTableWidget's state
+                # Check if the item is in edit mode via the view's state
                 state = self.controls_table.state()
-                from PyQt6.QtWidgets import QAbstractItemView
                 if state == QAbstractItemView.State.EditingState:
                     # There's an active edit - commit it by setting focus elsewhere
-                    # This will trigger the itemChanged signal with the current editor value
-                    self.controls_table.setCurrentItem(None)
+                    # The delegate commits the editor text through BindingsTableModel.setData, which emits label_edited
+                    self.controls_table.setCurrentIndex(QModelIndex())
                     # Small delay to let the edit complete
-                    from PyQt6.QtCore import QTimer
                     QTimer.singleShot(0, self._complete_toggle_view)
                     return
 
@@ -875,11 +1098,8 @@ class MainWindow(QMainWindow):
 
     def _complete_toggle_view(self):
         """Complete the view toggle after any pending edits are committed"""
-        # Repopulate the table with the new view mode
-        self.populate_controls_table()
-
-        # Reapply filters
-        self.apply_filters()
+        # Only the shown columns change; the rows and filters stay as they are
+        self._apply_view_mode()
 
         # Update status message
         view_mode = "detailed" if self.show_detailed_checkbox.isChecked() else "default"
@@ -888,10 +1108,11 @@ class MainWindow(QMainWindow):
     def clear_filters(self):
         """Clear all filters"""
         self.search_box.clear()
+        self.on_search_text_changed()
         self.device_filter.setCurrentIndex(0)
         self.actionmap_filter.setCurrentIndex(0)
         self.hide_unmapped_checkbox.setChecked(False)
-        self.statusBar().showMessage(f"Filters cleared - showing all {self.controls_table.rowCount()} bindings")
+        self.statusBar().showMessage(f"Filters cleared - showing all {self.bindings_model.rowCount()} bindings")
 
     def on_tab_changed(self, index: int):
         """Handle tab change - sync device selection when switching to Device View tab"""
@@ -905,20 +1126,14 @@ class MainWindow(QMainWindow):
 
     def show_table_context_menu(self, position):
         """Show context menu for table row"""
-        # Get the item at the clicked position
-        item = self.controls_table.itemAt(position)
-        if not item:
-            return
-
-        # Get binding data from the item
-        binding_data = item.data(Qt.ItemDataRole.UserRole)
+        # Get the binding for the row at the clicked position
+        binding_data = self._binding_at(self.controls_table.indexAt(position))
         if not binding_data:
             return
 
         action_map_name, binding = binding_data
 
         # Create context menu
-        from PyQt6.QtWidgets import QMenu
         menu = QMenu(self)
 
         # Add "Remap Button..." action
@@ -958,8 +1173,7 @@ class MainWindow(QMainWindow):
         # Update custom label
         if new_label:
             try:
-                from utils.label_overrides import get_override_manager
-                override_manager = get_override_manager()
+                override_manager = self._overrides()
 
                 # Get default label
                 default_label = LabelGenerator.generate_action_label(binding.action_name)
@@ -973,8 +1187,6 @@ class MainWindow(QMainWindow):
                     override_manager.set_custom_override(binding.action_name, new_label)
                     binding.custom_label = new_label
 
-                override_manager.reload()
-
             except Exception as e:
                 logger.error(f"Error updating label: {e}", exc_info=True)
 
@@ -989,8 +1201,6 @@ class MainWindow(QMainWindow):
 
     def edit_label_from_context(self, binding):
         """Edit label from context menu (simpler than full remap dialog)"""
-        from PyQt6.QtWidgets import QInputDialog
-
         current_label = LabelGenerator.get_action_label(binding.action_name, binding)
 
         new_label, ok = QInputDialog.getText(
@@ -1002,8 +1212,7 @@ class MainWindow(QMainWindow):
 
         if ok and new_label != current_label:
             try:
-                from utils.label_overrides import get_override_manager
-                override_manager = get_override_manager()
+                override_manager = self._overrides()
 
                 # Get default label
                 default_label = LabelGenerator.generate_action_label(binding.action_name)
@@ -1017,8 +1226,6 @@ class MainWindow(QMainWindow):
                     override_manager.set_custom_override(binding.action_name, new_label)
                     binding.custom_label = new_label
 
-                override_manager.reload()
-
                 # Mark profile as modified (for label changes)
                 if self.current_profile:
                     self.current_profile.mark_modified()
@@ -1032,56 +1239,35 @@ class MainWindow(QMainWindow):
                 logger.error(f"Error updating label: {e}", exc_info=True)
                 QMessageBox.warning(self, "Error", f"Failed to update label: {str(e)}")
 
-    def on_item_double_clicked(self, item):
-        """Handle double-click - prepare for editing"""
-        if item.column() == 2:  # Action (Override) column
-            # Get the binding data to store the default label for comparison
-            binding_data = item.data(Qt.ItemDataRole.UserRole)
-            if binding_data:
-                action_map_name, binding = binding_data
-                # Store the DEFAULT label (without ANY custom override - not from file, not from binding)
-                # We need to get the true default: global override or auto-generated
-                # To do this, we use use_override=False to skip the override manager
-                self._editing_default_text = LabelGenerator.generate_action_label(binding.action_name)
-
-                # Check if there's a global override (not custom)
-                try:
-                    from utils.label_overrides import get_override_manager
-                except ImportError:
-                    from ..utils.label_overrides import get_override_manager
-
-                override_manager = get_override_manager()
-                global_overrides = override_manager.load_global_overrides()
-                if binding.action_name in global_overrides:
-                    self._editing_default_text = global_overrides[binding.action_name]
-
-                logger.debug(f"on_item_double_clicked: default='{self._editing_default_text}', current='{item.text()}'")
-            else:
-                self._editing_default_text = None
-
-    def on_cell_edited(self, item):
-        """Handle cell editing (only column 2: Action Override is editable)"""
-        if item.column() != 2:  # Only Action (Override) column is editable
-            return
-
+    def _overrides(self):
+        """Return the label override manager, fetching it on first use"""
+        if self._override_manager is None:
+            self._override_manager = get_override_manager()
+        return self._override_manager
+
+    def _default_action_label(self, action_name: str) -> str:
+        """Return an action's label without any custom override: global override or auto-generated"""
+        global_overrides = self._overrides().load_global_overrides()
+        if action_name in global_overrides:
+            return global_overrides[action_name]
+        return LabelGenerator.generate_action_label(action_name)
+
+    def on_cell_edited(self, row: int, text: str):
+        """Handle an edit of a row's Action (Override) cell, the only editable column"""
         # Get the new text from the editor
-        new_label = item.text().strip()
-
-        # Get stored default text
-        default_text = self._editing_default_text
+        new_label = text.strip()
 
-        # Clear editing state
-        self._editing_item = None
-        self._editing_default_text = None
-
-        # Get the binding data stored in the item
-        binding_data = item.data(Qt.ItemDataRole.UserRole)
+        # Get the binding data for the edited row
+        binding_data = self.all_bindings[row] if row < len(self.all_bindings) else None
         if not binding_data:
             self.statusBar().showMessage("Error: Could not save label override")
             return
 
         action_map_name, binding = binding_data
 
+        # Compare against the true default (global override or auto-generated), not the custom label
+        default_text = self._default_action_label(binding.action_name)
+
         # Debug logging
         logger.debug(f"on_cell_edited: action={binding.action_name}, new_label='{new_label}', default='{default_text}'")
 
@@ -1095,21 +1281,10 @@ class MainWindow(QMainWindow):
             fallback_label = LabelGenerator.get_action_label(binding.action_name, binding)
             logger.debug(f"Label cleared or matches default, falling back to: '{fallback_label}'")
 
-            # Update the table to show the fallback label
-            self.controls_table.blockSignals(True)
-            item.setText(fallback_label)
-            self.controls_table.blockSignals(False)
 
             # Remove from the override file
             try:
-                # Import with error handling for different execution contexts
-                try:
-                    from utils.label_overrides import get_override_manager
-                except ImportError:
-                    from ..utils.label_overrides import get_override_manager
-
-                override_manager = get_override_manager()
-                override_manager.remove_custom_override(binding.action_name)
+                self._overrides().remove_custom_override(binding.action_name)
 
                 if not new_label:
                     self.statusBar().showMessage(f"Custom label removed for '{binding.action_name}' - using default: '{fallback_label}'")
@@ -1122,48 +1297,65 @@ class MainWindow(QMainWindow):
 
             # Update Device View widget
             if self.pdf_device_widget:
-                self.pdf_device_widget.load_profile(self.current_profile)
+                self.pdf_device_widget.update_action_label(binding.action_name)
 
-            # Force reload override manager cache and repopulate the table
-            override_manager.reload()
-            self.populate_controls_table()
-            self.apply_filters()
+            # The manager's cache is already current; refresh the affected rows
+            self.refresh_action_labels(binding.action_name)
             return
 
         # New label is different from default - save as custom override
         try:
-            # Import with error handling for different execution contexts
-            try:
-                from utils.label_overrides import get_override_manager
-            except ImportError:
-                from ..utils.label_overrides import get_override_manager
-
-            override_manager = get_override_manager()
-            override_manager.set_custom_override(binding.action_name, new_label)
+            self._overrides().set_custom_override(binding.action_name, new_label)
 
             # Update binding's custom_label field
             binding.custom_label = new_label
 
-            # Update the table item to show the new custom label
-            self.controls_table.blockSignals(True)
-            item.setText(new_label)
-            self.controls_table.blockSignals(False)
-
             # Update Device View widget
             if self.pdf_device_widget:
-                self.pdf_device_widget.load_profile(self.current_profile)
+                self.pdf_device_widget.update_action_label(binding.action_name)
 
             self.statusBar().showMessage(f"Custom label saved: '{binding.action_name}' → '{new_label}'")
             logger.info(f"Saved custom override for '{binding.action_name}': '{new_label}'")
 
-            # Force reload override manager cache and repopulate the table
-            override_manager.reload()
-            self.populate_controls_table()
-            self.apply_filters()
+            # The manager's cache is already current; refresh the affected rows
+            self.refresh_action_labels(binding.action_name)
         except Exception as e:
             self.statusBar().showMessage(f"Error saving label override: {str(e)}")
             logger.error(f"Error saving label override: {e}", exc_info=True)
 
+    def refresh_action_labels(self, action_name: str):
+        """Update the Action (Override) cells and cached row strings for one action"""
+        for row, (_, binding) in enumerate(self.all_bindings):
+            if binding.action_name != action_name:
+                continue
+
+            label = LabelGenerator.get_action_label(binding.action_name, binding)
+            row_data = self._row_cache[row]
+            row_data = row_data[:2] + (label,) + row_data[3:]
+            self._row_cache[row] = row_data
+            self._row_search_blob[row] = (' '.join(row_data) + ' ').lower()
+
+            # The proxy re-filters and re-sorts changed rows itself
+            self.bindings_model.update_row(row)
+
+        self.update_filter_status()
+
+    def _iter_visible_rows(self, columns: list):
+        """
+        Yield the given columns of each visible table row, in view order
+
+        Visibility and order come from the filter proxy; the cell text comes
+        from the row cache instead of being read back from the model.
+        """
+        proxy = self.proxy_model
+        # Bound once; these run for every exported row
+        index = proxy.index
+        map_to_source = proxy.mapToSource
+        row_cache = self._row_cache
+        for row in range(proxy.rowCount()):
+            row_strings = row_cache[map_to_source(index(row, 0)).row()]
+            yield [row_strings[col] for col in columns]
+
     def export_csv(self):
         """Export profile to CSV"""
         if not self.current_profile:
@@ -1180,7 +1372,6 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            import csv
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
 
@@ -1197,13 +1388,7 @@ class MainWindow(QMainWindow):
                     visible_cols = [0, 2, 4, 5]  # Action Map, Action (Override), Input Label, Device
 
                 # Write visible rows only
-                for row in range(self.controls_table.rowCount()):
-                    if not self.controls_table.isRowHidden(row):
-                        row_data = []
-                        for col in visible_cols:
-                            item = self.controls_table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        writer.writerow(row_data)
+                writer.writerows(self._iter_visible_rows(visible_cols))
 
             QMessageBox.information(self, "Success", f"Profile exported to:\n{file_path}")
             self.statusBar().showMessage(f"Exported to CSV: {file_path}")
@@ -1264,17 +1449,10 @@ class MainWindow(QMainWindow):
                 visible_cols = [0, 2, 4, 5]
                 col_widths = [2*inch, 3*inch, 2.5*inch, 1.5*inch]
 
-            for row in range(self.controls_table.rowCount()):
-                if not self.controls_table.isRowHidden(row):
-                    row_data = []
-                    for col in visible_cols:
-                        item = self.controls_table.item(row, col)
-                        row_data.append(item.text() if item else "")
-                    table_data.append(row_data)
+            table_data.extend(self._iter_visible_rows(visible_cols))
 
-            # Create table
-            table = Table(table_data, colWidths=col_widths)
-            table.setStyle(TableStyle([
+            # Styles are built once and shared by every table block
+            header_style = TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -1285,9 +1463,27 @@ class MainWindow(QMainWindow):
                 ('GRID', (0, 0), (-1, -1), 1, colors.black),
                 ('FONTSIZE', (0, 1), (-1, -1), 8),
                 ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
-
+            ])
+            body_style = TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('BACKGROUND', (0, 0), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTSIZE', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.lightgrey]),
+            ])
+
+            # Create the table as consecutive blocks that render as one table.
+            # reportlab re-wraps the whole remainder of a table each time it
+            # splits it across a page, so a single table grows quadratically.
+            # Blocks hold an even number of rows to keep the row shading in step.
+            block_size = 50
+            table = Table(table_data[:block_size + 1], colWidths=col_widths)
+            table.setStyle(header_style)
             elements.append(table)
+            for start in range(block_size + 1, len(table_data), block_size):
+                table = Table(table_data[start:start + block_size], colWidths=col_widths)
+                table.setStyle(body_style)
+                elements.append(table)
 
             # Build PDF
             doc.build(elements)
@@ -1315,7 +1511,9 @@ class MainWindow(QMainWindow):
             return
 
         try:
+            import copy
             from docx import Document
+            from docx.oxml.ns import qn
             from docx.shared import Inches, Pt, RGBColor
             from docx.enum.text import WD_ALIGN_PARAGRAPH
 
@@ -1370,13 +1568,22 @@ class MainWindow(QMainWindow):
                     for run in paragraph.runs:
                         run.font.bold = True
 
-            # Add data rows
-            for row in range(self.controls_table.rowCount()):
-                if not self.controls_table.isRowHidden(row):
-                    row_cells = table.add_row().cells
-                    for i, col in enumerate(visible_cols):
-                        item = self.controls_table.item(row, col)
-                        row_cells[i].text = item.text() if item else ""
+            # Add data rows by copying one template <w:tr> and filling in its
+            # <w:t> elements; table.add_row() and cell.text rebuild the cell
+            # objects for every row and dominate the export time
+            template_row = table.add_row()._tr
+            for tc in template_row.tc_lst:
+                tc.clear_content()
+                tc.add_p().add_r().add_t('')
+            table._tbl.remove(template_row)
+
+            for row_data in self._iter_visible_rows(visible_cols):
+                tr = copy.deepcopy(template_row)
+                for t, text in zip(tr.iter(qn('w:t')), row_data):
+                    t.text = text
+                    if text != text.strip():
+                        t.set(qn('xml:space'), 'preserve')
+                table._tbl.append(tr)
 
             # Save document
             doc.save(file_path)
@@ -1652,7 +1859,6 @@ class MainWindow(QMainWindow):
 
     def create_anchor_id(self, header_text):
         """Create an anchor ID from header text (GitHub-style)"""
-        import re
         # Convert to lowercase
         anchor = header_text.lower()
         # Replace spaces with hyphens
@@ -1663,8 +1869,6 @@ class MainWindow(QMainWindow):
 
     def format_inline_markdown(self, text):
         """Format inline markdown (bold, italic, code, links)"""
-        import re
-
         # Bold
         text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
         # Italic
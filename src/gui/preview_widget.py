@@ -11,4 +11,6 @@ class PreviewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         # TODO: Implement preview display
+        # Cache the on-screen preview as a QPixmap (optimised for drawing to the
+        # screen); exports render into an RGB32 QImage, as the device widgets do
         pass
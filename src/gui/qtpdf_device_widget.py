@@ -8,10 +8,12 @@ that open dialog popups for editing labels.
 import sys
 import os
 import logging
+from collections import defaultdict
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QComboBox, QMessageBox, QGraphicsView, QGraphicsScene,
-                              QGraphicsPixmapItem, QInputDialog, QPushButton, QSizePolicy, QToolTip)
-from PyQt6.QtGui import QPainter, QFont
+                              QGraphicsPixmapItem, QInputDialog, QPushButton, QSizePolicy, QToolTip,
+                              QFileDialog)
+from PyQt6.QtGui import QPainter, QFont, QImage, QImageWriter
 from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QTimer
 
 # Add parent directory to path
@@ -22,9 +24,14 @@ from models.profile_model import ControlProfile, Device
 from parser.label_generator import LabelGenerator
 from utils.device_joystick_mapper import DeviceJoystickMapper
 from utils.device_splitter import get_friendly_device_name
+from utils.label_overrides import get_override_manager
 
 logger = logging.getLogger(__name__)
 
+# Qt scales PNG compression 0-100 onto zlib levels 0-9; 11-20 selects level 1, which
+# encodes several times faster than the default for a slightly larger file
+_PNG_FAST_COMPRESSION = 15
+
 
 class InteractivePDFGraphicsView(QGraphicsView):
     """Custom QGraphicsView with clickable form fields"""
@@ -259,6 +266,7 @@ class QtPdfDeviceWidget(QWidget):
         self.device_mapper: DeviceJoystickMapper = None
         self.current_field_values: dict = {}  # Store current field values
         self.field_to_input_code: dict = {}  # Map PDF field names to input codes
+        self.current_pixmap = None  # Rendered page shown in the scene, reused for PNG export
 
         self.setup_ui()
 
@@ -447,6 +455,7 @@ class QtPdfDeviceWidget(QWidget):
         item_data = self.device_combo.itemData(index)
         if not item_data:
             self.scene.clear()
+            self.current_pixmap = None
             self.status_label.setText("No device selected")
             self.export_available_changed.emit(False)
             return
@@ -481,6 +490,7 @@ class QtPdfDeviceWidget(QWidget):
 
         if not template:
             self.scene.clear()
+            self.current_pixmap = None
             self.status_label.setText("No PDF template available for this device")
             self.export_available_changed.emit(False)
             return
@@ -490,6 +500,7 @@ class QtPdfDeviceWidget(QWidget):
         # Verify PDF exists
         if not os.path.exists(template.pdf_path):
             self.scene.clear()
+            self.current_pixmap = None
             self.status_label.setText(f"PDF template not found: {template.pdf_path}")
             self.export_available_changed.emit(False)
             return
@@ -507,6 +518,7 @@ class QtPdfDeviceWidget(QWidget):
 
             if pixmap is None or pixmap.isNull():
                 self.scene.clear()
+                self.current_pixmap = None
                 self.status_label.setText(f"Failed to render PDF: {template.pdf_path}")
                 self.export_available_changed.emit(False)
                 return
@@ -515,6 +527,7 @@ class QtPdfDeviceWidget(QWidget):
             self.scene.clear()
             pixmap_item = QGraphicsPixmapItem(pixmap)
             self.scene.addItem(pixmap_item)
+            self.current_pixmap = pixmap
 
             # Set clickable field regions in the view (with full labels for tooltips)
             full_labels = getattr(self, 'field_full_labels', {})
@@ -529,9 +542,24 @@ class QtPdfDeviceWidget(QWidget):
         except Exception as e:
             logger.error(f"Error rendering PDF template: {e}", exc_info=True)
             self.scene.clear()
+            self.current_pixmap = None
             self.status_label.setText(f"Error rendering PDF: {str(e)}")
             self.export_available_changed.emit(False)
 
+    def update_action_label(self, action_name: str):
+        """
+        Refresh the shown device after an action's label changed
+
+        Only the current device is re-rendered, and only when one of its field
+        values actually changed; the device list and selection are kept.
+        """
+        if not self.current_device or not self.current_template:
+            return
+
+        if self.get_field_values_for_device() != self.current_field_values:
+            logger.debug(f"Label change for '{action_name}' affects the current device, re-rendering")
+            self.load_device_pdf()
+
     def get_field_values_for_device(self) -> dict:
         """Get PDF form field values for the current device"""
         field_values = {}
@@ -557,7 +585,6 @@ class QtPdfDeviceWidget(QWidget):
             logger.debug(f"Found {len(device_bindings)} device bindings")
 
             # Group bindings by input code
-            from collections import defaultdict
             grouped_bindings = defaultdict(list)
 
             for action_map_name, binding in device_bindings:
@@ -812,7 +839,6 @@ class QtPdfDeviceWidget(QWidget):
             self.current_profile.mark_modified()
 
         # Reload override manager cache
-        from utils.label_overrides import get_override_manager
         override_manager = get_override_manager()
         override_manager.reload()
 
@@ -839,8 +865,6 @@ class QtPdfDeviceWidget(QWidget):
     def update_binding_label(self, binding, new_label: str):
         """Update a binding's custom label"""
         try:
-            from utils.label_overrides import get_override_manager
-
             override_manager = get_override_manager()
 
             # Get default label
@@ -877,8 +901,6 @@ class QtPdfDeviceWidget(QWidget):
             QMessageBox.warning(self, "No Template", "No device template is currently loaded.")
             return
 
-        from PyQt6.QtWidgets import QFileDialog
-
         # Create default filename
         device_name = (self.current_device.product_name or 'device').replace(' ', '_')
         default_filename = f"{device_name}_controls.png"
@@ -910,49 +932,53 @@ class QtPdfDeviceWidget(QWidget):
             QMessageBox.critical(self, "Export Error", f"Failed to export graphic:\n{str(e)}")
             self.status_label.setText("Export failed")
 
-    def export_to_png(self, file_path: str):
-        """Export scene to PNG"""
-        from PyQt6.QtGui import QImage
+    def _render_scene_to_image(self, width: int, height: int, antialias: bool = True):
+        """
+        Render the whole scene into a new image of the given size
 
-        # Get scene bounding rect
-        rect = self.scene.sceneRect()
+        The scene is drawn straight into the target rect, so a smaller image
+        costs proportionally less to render instead of being rendered at full
+        size and scaled down afterwards. Antialiasing roughly doubles the cost
+        of the raster paint, so renders that are downscaled again can skip it.
 
-        # Create image
-        image = QImage(int(rect.width()), int(rect.height()), QImage.Format.Format_ARGB32)
+        Exports go through QImage (RGB32 is one of QPainter's fastest raster
+        targets); on-screen display keeps using the QPixmap in the scene.
+        """
+        image = QImage(width, height, QImage.Format.Format_RGB32)
         image.fill(Qt.GlobalColor.white)
 
-        # Render scene to image
         painter = QPainter(image)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.scene.render(painter)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialias)
+        self.scene.render(painter, QRectF(0, 0, width, height), self.scene.sceneRect(),
+                          Qt.AspectRatioMode.KeepAspectRatio)
         painter.end()
 
-        # Save image
-        image.save(file_path, "PNG")
+        return image
 
-    def export_to_pdf(self, file_path: str):
-        """Export as PDF with populated fields"""
-        import tempfile
-        import shutil
+    def export_to_png(self, file_path: str):
+        """Export scene to PNG"""
+        if self.current_pixmap is not None:
+            # The scene is just the rendered page, so save that instead of rendering it again
+            image = self.current_pixmap.toImage()
+        else:
+            # Render at full scene resolution, antialiased for a standalone image
+            rect = self.scene.sceneRect()
+            image = self._render_scene_to_image(int(rect.width()), int(rect.height()), antialias=True)
 
-        # Create populated PDF
-        temp_dir = os.path.dirname(self.current_template.pdf_path)
-        fd, temp_pdf_path = tempfile.mkstemp(suffix='.pdf', dir=temp_dir, prefix='export_')
-        os.close(fd)
+        # Save image with fast deflate; PNG is lossless at every level
+        writer = QImageWriter(file_path, b"PNG")
+        writer.setCompression(_PNG_FAST_COMPRESSION)
+        if not writer.write(image):
+            raise IOError(writer.errorString())
 
+    def export_to_pdf(self, file_path: str):
+        """Export as PDF with populated fields"""
+        # Populate straight into the destination instead of a temp file that is then copied
         populated_pdf_path = self.pdf_manager.populate_pdf(
             self.current_template,
             self.current_field_values,
-            temp_pdf_path
+            file_path
         )
 
-        if populated_pdf_path:
-            # Copy to final location
-            shutil.copy2(populated_pdf_path, file_path)
-            # Clean up temp file
-            try:
-                os.remove(populated_pdf_path)
-            except:
-                pass
-        else:
+        if not populated_pdf_path:
             raise Exception("Failed to populate PDF")
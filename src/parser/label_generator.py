@@ -8,6 +8,16 @@ from typing import Dict, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from ..models.profile_model import ActionBinding
 
+# Import once with error handling for different execution contexts; without it
+# labels simply fall back to the auto-generated text
+try:
+    from utils.label_overrides import get_override_manager
+except ImportError:
+    try:
+        from ..utils.label_overrides import get_override_manager
+    except ImportError:
+        get_override_manager = None
+
 
 class LabelGenerator:
     """Generates human-readable labels for actions and inputs"""
@@ -98,14 +108,8 @@ class LabelGenerator:
             return binding.custom_label
 
         # Priority 2: Check override manager
-        if use_override:
+        if use_override and get_override_manager is not None:
             try:
-                # Import with error handling for different execution contexts
-                try:
-                    from utils.label_overrides import get_override_manager
-                except ImportError:
-                    from ..utils.label_overrides import get_override_manager
-
                 override_manager = get_override_manager()
                 override_label = override_manager.get_override_label(action_name)
                 if override_label:
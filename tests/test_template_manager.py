@@ -0,0 +1,156 @@
+"""
+Unit tests for device template matching
+"""
+
+import unittest
+import random
+import sys
+import os
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from graphics import template_manager
+from graphics.template_manager import TemplateManager, DeviceTemplate
+
+
+def linear_find_template(templates, device_name):
+    """Reference: the original in-order scan over templates and their patterns"""
+    if not device_name:
+        return None
+    device_name_lower = device_name.lower()
+    for template in templates:
+        for pattern in template.device_match_patterns:
+            if pattern.lower() in device_name_lower:
+                return template
+    return None
+
+
+def make_template(template_id, patterns):
+    """Build an image template with the given match patterns"""
+    return DeviceTemplate(
+        id=template_id,
+        name=template_id,
+        image_path=f"{template_id}.png",
+        device_match_patterns=patterns,
+        device_type='joystick',
+        button_coordinates={}
+    )
+
+
+# Overlapping patterns where the earliest or longest match in the device name
+# is not the first-registered template
+OVERLAPPING_TEMPLATES = [
+    ('gladiator_evo', ["Gladiator EVO"]),
+    ('vkbsim_gladiator', ["VKBsim Gladiator", "VKB"]),
+    ('evo_right', ["Gladiator EVO R"]),
+    ('legend', ["no such device", "stick"]),
+    ('legend_stick', ["Legend Stick"]),
+    ('duplicate', ["Gladiator EVO"]),
+    ('sem', ["SEM"]),
+    ('gunfighter', ["Gunfighter", "VKBsim Gunfighter"]),
+]
+
+DEVICE_NAMES = [
+    "VKBsim Gladiator EVO R",
+    "VKBsim Gladiator EVO L",
+    " VKB-Sim Gladiator NXT EVO SEM L",
+    "Legend Stick",
+    "VKBsim Gunfighter MCG",
+    "vkbsim gladiator evo r",
+    "Thrustmaster T.16000M",
+    "",
+]
+
+
+class TestFindTemplate(unittest.TestCase):
+    """find_template must return what the original linear scan returned"""
+
+    def make_manager(self, templates):
+        """Template manager over in-memory templates, with its matcher built"""
+        manager = TemplateManager('unused')
+        manager._templates = list(templates)
+        manager._loaded = True
+        manager._build_matcher()
+        return manager
+
+    def assert_matches_linear_scan(self, manager, templates, device_names):
+        for device_name in device_names:
+            expected = linear_find_template(templates, device_name)
+            actual = manager.find_template(device_name)
+            self.assertIs(actual, expected, f"device name {device_name!r}")
+
+    def overlapping_templates(self):
+        return [make_template(template_id, patterns) for template_id, patterns in OVERLAPPING_TEMPLATES]
+
+    def random_cases(self, seed):
+        """Short patterns over a tiny alphabet, so matches overlap heavily"""
+        rng = random.Random(seed)
+        templates = [
+            make_template(f"t{i}", [''.join(rng.choice('abAB') for _ in range(rng.randint(1, 3)))
+                                    for _ in range(rng.randint(1, 3))])
+            for i in range(12)
+        ]
+        device_names = [''.join(rng.choice('abcAB') for _ in range(rng.randint(0, 8))) for _ in range(300)]
+        return templates, device_names
+
+    @unittest.skipUnless(template_manager._HAS_AHOCORASICK, "pyahocorasick not installed")
+    def test_automaton_overlapping_patterns(self):
+        """Aho-Corasick branch keeps first-registered-pattern-wins"""
+        templates = self.overlapping_templates()
+        manager = self.make_manager(templates)
+        self.assertIsNotNone(manager._automaton)
+
+        self.assert_matches_linear_scan(manager, templates, DEVICE_NAMES)
+        self.assertEqual(manager.find_template("VKBsim Gladiator EVO R").id, 'gladiator_evo')
+        self.assertEqual(manager.find_template("Legend Stick").id, 'legend')
+
+    @unittest.skipUnless(template_manager._HAS_AHOCORASICK, "pyahocorasick not installed")
+    def test_automaton_random_patterns(self):
+        """Aho-Corasick branch agrees with the linear scan on random overlaps"""
+        for seed in range(20):
+            templates, device_names = self.random_cases(seed)
+            manager = self.make_manager(templates)
+            self.assertIsNotNone(manager._automaton)
+            self.assert_matches_linear_scan(manager, templates, device_names)
+
+    def test_regex_overlapping_patterns(self):
+        """Combined-regex branch keeps first-registered-pattern-wins"""
+        templates = self.overlapping_templates()
+        with mock.patch.object(template_manager, '_HAS_AHOCORASICK', False):
+            manager = self.make_manager(templates)
+        self.assertIsNone(manager._automaton)
+        self.assertIsNotNone(manager._combined)
+
+        self.assert_matches_linear_scan(manager, templates, DEVICE_NAMES)
+        self.assertEqual(manager.find_template("VKBsim Gladiator EVO R").id, 'gladiator_evo')
+        self.assertEqual(manager.find_template("Legend Stick").id, 'legend')
+
+    def test_regex_random_patterns(self):
+        """Combined-regex branch agrees with the linear scan on random overlaps"""
+        for seed in range(20):
+            templates, device_names = self.random_cases(seed)
+            with mock.patch.object(template_manager, '_HAS_AHOCORASICK', False):
+                manager = self.make_manager(templates)
+            self.assertIsNotNone(manager._combined)
+            self.assert_matches_linear_scan(manager, templates, device_names)
+
+    def test_empty_pattern_matches_everything(self):
+        """An empty pattern falls back to the regex and still matches any name"""
+        templates = [make_template('named', ["Gladiator"]), make_template('catch_all', [""]),
+                     make_template('later', ["Stick"])]
+        manager = self.make_manager(templates)
+        self.assertIsNone(manager._automaton)
+
+        self.assert_matches_linear_scan(manager, templates, DEVICE_NAMES)
+        self.assertEqual(manager.find_template("Legend Stick").id, 'catch_all')
+
+    def test_no_templates(self):
+        """No templates means no match"""
+        manager = self.make_manager([])
+        self.assertIsNone(manager.find_template("VKBsim Gladiator EVO R"))
+
+
+if __name__ == '__main__':
+    unittest.main()